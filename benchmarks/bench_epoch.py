@@ -0,0 +1,39 @@
+import timeit
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from now import epoch
+from now.now import Now
+
+ZONES = {
+    "UTC": timezone.utc,
+    "America/New_York": ZoneInfo("America/New_York"),
+}
+
+TIMESTAMP = 1665485545
+
+
+def main(number: int = 100000) -> None:
+    print(f"{'boundary':<34} {'Now':>10} {'epoch':>10} {'speedup':>8}")
+
+    for name, tz in ZONES.items():
+        for boundary in ("beginning_of_day", "end_of_quarter"):
+            compute = getattr(epoch, boundary)
+
+            def through_now() -> float:
+                time = datetime.fromtimestamp(TIMESTAMP, tz)
+                return getattr(Now(time), boundary)().timestamp()
+
+            assert compute(TIMESTAMP, tz) == through_now()
+
+            before = timeit.timeit(through_now, number=number)
+            after = timeit.timeit(lambda: compute(TIMESTAMP, tz), number=number)
+
+            print(
+                f"{boundary + ' ' + name:<34} {before / number * 1e6:>8.2f}us "
+                f"{after / number * 1e6:>8.2f}us {before / after:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
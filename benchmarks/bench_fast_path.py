@@ -0,0 +1,40 @@
+import timeit
+from datetime import datetime
+
+from now.time_format import TIME_FORMATS, parse
+
+INPUTS = {
+    "%Y-%m-%d %H:%M:%S": "2006-01-02 15:04:05",
+    "%Y-%m-%dT%H:%M:%SZ%z": "2006-01-02T15:04:05Z-0700",
+    "%Y%m%d": "20060102",
+    "%Y/%m/%d": "2006/01/02",
+    "%Y.%m.%d %H:%M:%S.%f": "2006.01.02 15:04:05.999999",
+}
+
+
+def strptime_loop(string: str) -> datetime:
+    for time_format in TIME_FORMATS:
+        try:
+            return datetime.strptime(string, time_format)
+        except ValueError:
+            pass
+    raise ValueError(string)
+
+
+def main(number: int = 20000) -> None:
+    print(f"{'format':<24} {'strptime loop':>14} {'parse':>10} {'speedup':>8}")
+
+    for time_format, string in INPUTS.items():
+        assert parse(string) == strptime_loop(string)
+
+        before = timeit.timeit(lambda: strptime_loop(string), number=number)
+        after = timeit.timeit(lambda: parse(string), number=number)
+
+        print(
+            f"{time_format:<24} {before / number * 1e6:>12.2f}us "
+            f"{after / number * 1e6:>8.2f}us {before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from now.formatter import format
+from now.time_format import TIME_FORMATS
+
+TIME = datetime(2006, 1, 2, 15, 4, 5, 999999, timezone(timedelta(hours=-7)))
+
+
+def main(number: int = 20000) -> None:
+    print(f"{'format':<28} {'strftime':>10} {'format':>10} {'speedup':>8}")
+
+    for time_format in TIME_FORMATS:
+        assert format(TIME, time_format) == TIME.strftime(time_format)
+
+        before = min(
+            timeit.repeat(lambda: TIME.strftime(time_format), number=number, repeat=5)
+        )
+        after = min(
+            timeit.repeat(lambda: format(TIME, time_format), number=number, repeat=5)
+        )
+
+        print(
+            f"{time_format:<28} {before / number * 1e6:>8.2f}us "
+            f"{after / number * 1e6:>8.2f}us {before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+import timeit
+
+import now
+from now.clock import Clock, CoarseClock
+
+CALLS = {
+    "quarter": (),
+    "beginning_of_minute": (),
+    "beginning_of_hour": (),
+    "beginning_of_day": (),
+    "beginning_of_week": (),
+    "beginning_of_month": (),
+    "beginning_of_quarter": (),
+    "beginning_of_half": (),
+    "beginning_of_year": (),
+    "end_of_minute": (),
+    "end_of_hour": (),
+    "end_of_day": (),
+    "end_of_week": (),
+    "end_of_month": (),
+    "end_of_quarter": (),
+    "end_of_half": (),
+    "end_of_year": (),
+    "monday": ("12:00",),
+    "sunday": ("12:30",),
+    "parse": ("12:30",),
+    "between": ("12:30", "13:00"),
+}
+
+
+def main(number: int = 20000) -> None:
+    print(f"{'function':<22} {'with_()':>10} {'now.<name>':>11} {'speedup':>8}")
+
+    for name, args in CALLS.items():
+        function = getattr(now, name)
+
+        before = timeit.timeit(lambda: getattr(now.with_(), name)(*args), number=number)
+        after = timeit.timeit(lambda: function(*args), number=number)
+
+        print(
+            f"{name:<22} {before / number * 1e6:>8.2f}us "
+            f"{after / number * 1e6:>9.2f}us {before / after:>7.1f}x"
+        )
+
+    now.clock = CoarseClock()
+    try:
+        for name in ("beginning_of_hour", "beginning_of_day", "end_of_month"):
+            function = getattr(now, name)
+            elapsed = min(timeit.repeat(function, number=number, repeat=5))
+            print(f"{name + ' (coarse)':<33} {elapsed / number * 1e6:>9.2f}us")
+    finally:
+        now.clock = Clock()
+
+    with now.using(week_start_day=now.WeekStartDay.MONDAY):
+        for name in ("beginning_of_week", "end_of_month", "parse"):
+            function = getattr(now, name)
+            args = CALLS[name]
+            elapsed = min(
+                timeit.repeat(lambda: function(*args), number=number, repeat=5)
+            )
+            print(f"{name + ' (scoped)':<33} {elapsed / number * 1e6:>9.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from now import Config
+from now.clock import Clock
+from now.scheduler import Scheduler
+
+START = datetime(2022, 10, 11, 10, 59, 59, 500000)
+
+
+async def dispatch(subscribers: int) -> tuple[float, float, int]:
+    loop = asyncio.get_running_loop()
+    origin = loop.time()
+    clock = Clock(lambda tz: START + timedelta(seconds=loop.time() - origin))
+    scheduler = Scheduler(Config(clock=clock))
+
+    done = asyncio.Event()
+    fired = 0
+    first = 0.0
+
+    def callback(boundary: datetime) -> None:
+        nonlocal fired, first
+        if not fired:
+            first = time.perf_counter()
+        fired += 1
+        if fired == subscribers:
+            done.set()
+
+    start = time.perf_counter()
+    for index in range(subscribers):
+        scheduler.subscribe("minute" if index % 2 else "hour", callback)
+    subscribed = time.perf_counter() - start
+
+    await done.wait()
+    dispatched = time.perf_counter() - first
+    timers = len(loop._scheduled)  # type: ignore[attr-defined]
+    scheduler.close()
+
+    return subscribed, dispatched, timers
+
+
+def main() -> None:
+    print(f"{'subscribers':>11} {'subscribe':>11} {'dispatch':>10} {'timers':>7}")
+
+    for subscribers in (100, 1000, 10000):
+        subscribed, dispatched, timers = asyncio.run(dispatch(subscribers))
+        print(
+            f"{subscribers:>11} {subscribed / subscribers * 1e6:>9.2f}us "
+            f"{dispatched * 1e3:>8.2f}ms {timers:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import timeit
+from datetime import datetime, timedelta
+
+from now import Now
+
+TIME = datetime(2022, 10, 11, 10, 52, 25)
+
+BOUNDARIES = [
+    f"{edge}_of_{period}"
+    for edge in ("beginning", "end")
+    for period in ("minute", "hour", "day", "week", "month", "quarter", "half", "year")
+]
+
+
+def query(now: Now) -> list[datetime]:
+    return [getattr(now, name)() for name in BOUNDARIES]
+
+
+def main(number: int = 20000) -> None:
+    cached = Now(TIME)
+    moving = Now(TIME)
+    times = [TIME + timedelta(seconds=second) for second in range(number)]
+
+    def move() -> list[datetime]:
+        moving.time = times.pop()
+        return query(moving)
+
+    cases = {
+        "new Now": lambda: query(Now(TIME)),
+        "same Now": lambda: query(cached),
+        "time setter": move,
+    }
+
+    print(f"{'all boundaries':<14} {'per query':>10} {'per boundary':>13}")
+    for name, case in cases.items():
+        elapsed = timeit.timeit(case, number=number) / number
+        print(
+            f"{name:<14} {elapsed * 1e6:>8.2f}us "
+            f"{elapsed / len(BOUNDARIES) * 1e6:>11.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
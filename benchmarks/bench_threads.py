@@ -0,0 +1,54 @@
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable
+
+from now.time_format import parse
+
+FORMATS = ["%a %b %d %H:%M:%S %Y", "%I:%M%p"]
+
+STRINGS = ["Mon Jan 02 15:04:05 2006", "3:04PM"] * 500
+
+
+def strptime_loop(string: str) -> datetime:
+    for time_format in FORMATS:
+        try:
+            return datetime.strptime(string, time_format)
+        except ValueError:
+            pass
+    raise ValueError(string)
+
+
+def work(function: Callable[[str], datetime], rounds: int) -> None:
+    for _ in range(rounds):
+        for string in STRINGS:
+            function(string)
+
+
+def throughput(function: Callable[[str], datetime], threads: int, rounds: int) -> float:
+    with ThreadPoolExecutor(threads) as executor:
+        start = time.perf_counter()
+        for future in [executor.submit(work, function, rounds) for _ in range(threads)]:
+            future.result()
+        elapsed = time.perf_counter() - start
+
+    return threads * rounds * len(STRINGS) / elapsed
+
+
+def main(rounds: int = 10) -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil}")
+    print(f"{'threads':>7} {'strptime loop':>16} {'parse':>16}")
+
+    for threads in (1, 2, 4, 8):
+        before = throughput(strptime_loop, threads, rounds)
+        after = throughput(
+            lambda string: parse(string, formats=FORMATS), threads, rounds
+        )
+
+        print(f"{threads:>7} {before:>12,.0f}/s {after:>12,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import timeit
+
+import numpy as np
+
+from now import vectorized
+from now.now import Now
+from now.time_format import parse
+
+METHODS = [
+    "beginning_of_day",
+    "beginning_of_week",
+    "beginning_of_month",
+    "beginning_of_quarter",
+    "end_of_week",
+    "end_of_month",
+    "end_of_quarter",
+    "end_of_year",
+]
+
+
+def main(size: int = 1_000_000) -> None:
+    start = np.datetime64("2000-01-01T00:00:00", "us")
+    times = start + np.arange(size, dtype=np.int64) * np.timedelta64(997_013, "ms")
+    objects = times.tolist()
+
+    print(f"{'method':<22} {'python loop':>14} {'vectorized':>14} {'speedup':>8}")
+
+    for method in METHODS:
+        function = getattr(vectorized, method)
+
+        before = timeit.timeit(
+            lambda: [getattr(Now(time), method)() for time in objects], number=1
+        )
+        after = timeit.timeit(lambda: function(times), number=1)
+
+        print(
+            f"{method:<22} {size / before:>10.0f}/s {size / after:>10.0f}/s "
+            f"{before / after:>7.1f}x"
+        )
+
+    strings = np.char.replace(np.datetime_as_string(times, unit="s"), "T", " ")
+    string_list = strings.tolist()
+
+    before = timeit.timeit(lambda: [parse(s) for s in string_list], number=1)
+    after = timeit.timeit(lambda: vectorized.parse(strings), number=1)
+
+    print(
+        f"{'parse':<22} {size / before:>10.0f}/s {size / after:>10.0f}/s "
+        f"{before / after:>7.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
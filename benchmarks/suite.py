@@ -0,0 +1,144 @@
+import argparse
+import json
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+import now
+from now.now import Now
+from now.time_format import TIME_FORMATS, parse
+
+SAMPLE = datetime(2006, 1, 2, 15, 4, 5, 999999, tzinfo=timezone(timedelta(hours=-7)))
+
+UNPARSEABLE = "not a time"
+
+BOUNDARIES = [
+    f"{edge}_of_{period}"
+    for edge in ("beginning", "end")
+    for period in ("minute", "hour", "day", "week", "month", "quarter", "half", "year")
+]
+
+Case = tuple[Callable[[], Any], dict[str, Any]]
+
+
+def _reject() -> None:
+    try:
+        parse(UNPARSEABLE)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError(UNPARSEABLE)
+
+
+def _recompute(boundaries: Now, name: str) -> datetime:
+    # Setting time drops the memoized boundaries, so every call computes.
+    boundaries.time = boundaries.time
+
+    return getattr(boundaries, name)()
+
+
+def _all_boundaries(time: datetime) -> list[datetime]:
+    boundaries = Now(time)
+
+    return [getattr(boundaries, name)() for name in BOUNDARIES]
+
+
+def cases() -> dict[str, Case]:
+    suite: dict[str, Case] = {}
+
+    for position, time_format in enumerate(TIME_FORMATS):
+        string = SAMPLE.strftime(time_format)
+        suite[f"parse {time_format}"] = (
+            lambda string=string: parse(string),
+            {"position": position, "input": string},
+        )
+    suite["parse unparseable"] = (_reject, {"input": UNPARSEABLE})
+
+    time = Now(SAMPLE.replace(tzinfo=None))
+    for name in BOUNDARIES:
+        suite[f"Now.{name}"] = (lambda name=name: _recompute(time, name), {})
+    suite["Now all boundaries"] = (lambda: _all_boundaries(time.time), {})
+
+    for name in BOUNDARIES + ["quarter", "half"]:
+        suite[f"now.with_().{name}"] = (
+            lambda name=name: getattr(now.with_(), name)(),
+            {},
+        )
+
+    return suite
+
+
+def run(number: int, repeat: int, pattern: str | None = None) -> dict[str, Any]:
+    results = {}
+
+    for name, (function, variables) in cases().items():
+        if pattern is not None and pattern not in name:
+            continue
+
+        elapsed = min(timeit.repeat(function, number=number, repeat=repeat))
+        results[name] = {"seconds": elapsed / number, **variables}
+
+    return results
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        ratio = result["seconds"] / baseline[name]["seconds"]
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {ratio:.2f}x slower than baseline")
+
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite",
+        description="Time parsing and boundary hot paths.",
+    )
+    parser.add_argument("-n", "--number", type=int, default=10000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("-k", "--filter", help="only run cases containing this")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare against a saved JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown reported as a regression (default 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.number, args.repeat, args.filter)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+    for name, result in results.items():
+        line = f"{name:<44} {result['seconds'] * 1e6:>9.2f}us"
+        if name in baseline:
+            line += f" {baseline[name]['seconds'] / result['seconds']:>7.2f}x"
+        print(line)
+
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(regression, file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
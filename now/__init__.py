@@ -1,7 +1,17 @@
+import contextlib
+import threading
+from contextvars import ContextVar
 from datetime import datetime, tzinfo
+from typing import Any, Callable, Iterable, Iterator
 
-from .now import Now, WeekStartDay
-from .time_format import TIME_FORMATS
+from . import formatter, time_format
+from .bucket import bucket as _bucket
+from .clock import Clock, CoarseClock, FrozenClock
+from .config import Config
+from .now import Now, Period, WeekStartDay
+from .periods import Periods
+from .time_format import TIME_FORMATS, ParseCache
+from .window import Window
 
 week_start_day: WeekStartDay = WeekStartDay.SUNDAY
 
@@ -9,101 +19,273 @@ time_zone: tzinfo | None = None
 
 time_formats: list[str] = TIME_FORMATS
 
+parse_cache: ParseCache | None = None
 
-def with_(time: datetime | None = None) -> Now:
-    if time is None:
-        time = datetime.now(tz=time_zone)
+resolve_time_zone: bool = False
+
+clock: Clock = Clock()
+
+_config: ContextVar[Config | None] = ContextVar("now_config", default=None)
+
+_contexts = threading.local()
 
-    return Now(
-        time=time,
-        time_formats=time_formats,
-        week_start_day=week_start_day,
+
+def _global_config() -> Config:
+    settings = (
+        time_formats,
+        week_start_day,
+        parse_cache,
+        resolve_time_zone,
+        time_zone,
+        clock,
     )
 
+    config: Config | None = getattr(_contexts, "config", None)
+    if config is None or _contexts.settings != settings:
+        config = _contexts.config = Config(
+            week_start_day=week_start_day,
+            time_zone=time_zone,
+            time_formats=time_formats,
+            parse_cache=parse_cache,
+            resolve_time_zone=resolve_time_zone,
+            clock=clock,
+        )
+        _contexts.settings = settings
+
+    return config
+
+
+def current_config() -> Config:
+    config = _config.get()
+    if config is None:
+        return _global_config()
+
+    return config
+
+
+@contextlib.contextmanager
+def using(config: Config | None = None, **changes: Any) -> Iterator[Config]:
+    if config is None:
+        config = current_config()
+    if changes:
+        config = config.replace(**changes)
+
+    token = _config.set(config)
+    try:
+        yield config
+    finally:
+        _config.reset(token)
+
+
+def _context() -> Now:
+    config = current_config()
+
+    context: Now = config._state().now
+    context.time = config.now()
+
+    return context
+
+
+_BOUNDARIES: dict[
+    Period, tuple[Callable[[Now], datetime], Callable[[Now], datetime]]
+] = {
+    Period.MINUTE: (Now.beginning_of_minute, Now.end_of_minute),
+    Period.HOUR: (Now.beginning_of_hour, Now.end_of_hour),
+    Period.DAY: (Now.beginning_of_day, Now.end_of_day),
+    Period.WEEK: (Now.beginning_of_week, Now.end_of_week),
+    Period.MONTH: (Now.beginning_of_month, Now.end_of_month),
+    Period.QUARTER: (Now.beginning_of_quarter, Now.end_of_quarter),
+    Period.HALF: (Now.beginning_of_half, Now.end_of_half),
+    Period.YEAR: (Now.beginning_of_year, Now.end_of_year),
+}
+
+
+def _bounds(period: Period) -> tuple[datetime, datetime]:
+    config = current_config()
+    state = config._state()
+
+    context: Now = state.now
+    time = context.time = config.now()
+
+    boundaries: dict[Period, tuple[datetime, datetime, datetime]]
+    boundaries = state.boundaries
+    cached = boundaries.get(period)
+    if cached is not None:
+        seen, beginning, end = cached
+        if seen is time:
+            return beginning, end
+        if beginning <= time <= end and seen.fold == time.fold:
+            boundaries[period] = time, beginning, end
+            return beginning, end
+
+    beginning_of, end_of = _BOUNDARIES[period]
+    beginning, end = beginning_of(context), end_of(context)
+    boundaries[period] = time, beginning, end
+
+    return beginning, end
+
+
+def with_(time: datetime | None = None) -> Now:
+    return current_config().with_(time)
+
 
 def quarter() -> int:
-    return with_().quarter()
+    return _context().quarter()
 
 
 def half() -> int:
-    return with_().half()
+    return _context().half()
 
 
 def beginning_of_minute() -> datetime:
-    return with_().beginning_of_minute()
+    return _bounds(Period.MINUTE)[0]
 
 
 def beginning_of_hour() -> datetime:
-    return with_().beginning_of_hour()
+    return _bounds(Period.HOUR)[0]
 
 
 def beginning_of_day() -> datetime:
-    return with_().beginning_of_day()
+    return _bounds(Period.DAY)[0]
 
 
 def beginning_of_week() -> datetime:
-    return with_().beginning_of_week()
+    return _bounds(Period.WEEK)[0]
 
 
 def beginning_of_month() -> datetime:
-    return with_().beginning_of_month()
+    return _bounds(Period.MONTH)[0]
 
 
 def beginning_of_quarter() -> datetime:
-    return with_().beginning_of_quarter()
+    return _bounds(Period.QUARTER)[0]
 
 
 def beginning_of_half() -> datetime:
-    return with_().beginning_of_half()
+    return _bounds(Period.HALF)[0]
 
 
 def beginning_of_year() -> datetime:
-    return with_().beginning_of_year()
+    return _bounds(Period.YEAR)[0]
 
 
 def end_of_minute() -> datetime:
-    return with_().end_of_minute()
+    return _bounds(Period.MINUTE)[1]
 
 
 def end_of_hour() -> datetime:
-    return with_().end_of_hour()
+    return _bounds(Period.HOUR)[1]
 
 
 def end_of_day() -> datetime:
-    return with_().end_of_day()
+    return _bounds(Period.DAY)[1]
 
 
 def end_of_week() -> datetime:
-    return with_().end_of_week()
+    return _bounds(Period.WEEK)[1]
 
 
 def end_of_month() -> datetime:
-    return with_().end_of_month()
+    return _bounds(Period.MONTH)[1]
 
 
 def end_of_quarter() -> datetime:
-    return with_().end_of_quarter()
+    return _bounds(Period.QUARTER)[1]
 
 
 def end_of_half() -> datetime:
-    return with_().end_of_half()
+    return _bounds(Period.HALF)[1]
 
 
 def end_of_year() -> datetime:
-    return with_().end_of_year()
+    return _bounds(Period.YEAR)[1]
 
 
 def monday(time: str) -> datetime:
-    return with_().monday(time)
+    return _context().monday(time)
 
 
 def sunday(time: str) -> datetime:
-    return with_().sunday(time)
+    return _context().sunday(time)
 
 
 def parse(time: str) -> datetime:
-    return with_().parse(time)
+    return _context().parse(time)
+
+
+def try_parse(time: str, default: datetime | None = None) -> datetime | None:
+    return _context().try_parse(time, default)
+
+
+def parse_many(
+    times: Iterable[str],
+    default_time: datetime | None = None,
+    formats: list[str] | None = None,
+    utc: bool = False,
+) -> Iterator[datetime]:
+    config = current_config()
+    if default_time is None:
+        default_time = config.now()
+
+    return time_format.parse_many(
+        times, default_time, formats or config.time_formats, utc
+    )
+
+
+def parse_many_epoch(
+    times: Iterable[str],
+    default_time: datetime | None = None,
+    formats: list[str] | None = None,
+) -> Iterator[int]:
+    config = current_config()
+    if default_time is None:
+        default_time = config.now()
+
+    return time_format.parse_many_epoch(
+        times, default_time, formats or config.time_formats
+    )
+
+
+def format(time: datetime, time_format: str) -> str:
+    return formatter.format(time, time_format)
+
+
+def format_many(
+    times: Iterable[datetime] | Any, time_format: str
+) -> Iterator[str] | Any:
+    return formatter.format_many(times, time_format)
 
 
 def between(begin: str, end: str) -> bool:
-    return with_().between(begin, end)
+    return _context().between(begin, end)
+
+
+def window(begin: str | datetime, end: str | datetime) -> Window:
+    return Window(begin, end, current_config().time_formats)
+
+
+def bucket(
+    items: Iterable[Any],
+    period: Period | str,
+    week_start_day: WeekStartDay | None = None,
+    reducer: Callable[[Any, Any], Any] | None = None,
+    initial: Any = 0,
+    key: Callable[[Any], datetime] | None = None,
+) -> dict[datetime, Any]:
+    if week_start_day is None:
+        week_start_day = current_config().week_start_day
+
+    return _bucket(items, period, week_start_day, reducer, initial, key)
+
+
+def periods(
+    start: datetime,
+    end: datetime,
+    unit: Period | str = Period.DAY,
+    week_start_day: WeekStartDay | None = None,
+) -> Periods:
+    config = current_config()
+    if week_start_day is None:
+        week_start_day = config.week_start_day
+
+    return Periods(start, end, unit, week_start_day)
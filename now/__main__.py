@@ -0,0 +1,41 @@
+import argparse
+import sys
+
+from . import parallel
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m now",
+        description="Parse a newline-delimited file of timestamps into epoch microseconds.",
+    )
+    parser.add_argument("input")
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="write native int64 values to this file instead of stdout",
+    )
+    parser.add_argument(
+        "-f", "--format", action="append", dest="formats", help="may be repeated"
+    )
+    parser.add_argument("-w", "--workers", type=int)
+    parser.add_argument("--invalid", type=int, help="value for unparseable lines")
+    parser.add_argument("--chunk-size", type=int, default=parallel.CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    options = dict(
+        formats=args.formats,
+        invalid=args.invalid,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+
+    if args.output:
+        parallel.convert_file(args.input, args.output, **options)
+    else:
+        for value in parallel.parse_file(args.input, **options):
+            sys.stdout.write(f"{value}\n")
+
+
+if __name__ == "__main__":
+    main()
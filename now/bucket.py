@@ -0,0 +1,32 @@
+from datetime import datetime, tzinfo
+from typing import Any, Callable, Iterable
+
+from .now import Period, WeekStartDay
+from .periods import period_key, period_start
+
+
+def bucket(
+    items: Iterable[Any],
+    period: Period | str,
+    week_start_day: WeekStartDay = WeekStartDay.SUNDAY,
+    reducer: Callable[[Any, Any], Any] | None = None,
+    initial: Any = 0,
+    key: Callable[[Any], datetime] | None = None,
+) -> dict[datetime, Any]:
+    period = Period(period)
+    get_key = period_key(period, week_start_day)
+
+    buckets: dict[tuple[int, tzinfo | None], Any] = {}
+    for item in items:
+        time = item if key is None else key(item)
+        bucket_key = (get_key(time), time.tzinfo)
+
+        if reducer is None:
+            buckets[bucket_key] = buckets.get(bucket_key, initial) + 1
+        else:
+            buckets[bucket_key] = reducer(buckets.get(bucket_key, initial), item)
+
+    return {
+        period_start(period, number, tz): value
+        for (number, tz), value in sorted(buckets.items(), key=lambda item: item[0][0])
+    }
@@ -0,0 +1,47 @@
+import time
+from datetime import datetime, timedelta, tzinfo
+from typing import Callable
+
+Source = Callable[[tzinfo | None], datetime]
+
+
+class Clock:
+    def __init__(self, source: Source = datetime.now) -> None:
+        self._source = source
+
+    def now(self, tz: tzinfo | None = None) -> datetime:
+        return self._source(tz)
+
+
+class FrozenClock(Clock):
+    def __init__(self, time: datetime) -> None:
+        super().__init__(self._frozen)
+
+        self.time = time
+
+    def _frozen(self, tz: tzinfo | None) -> datetime:
+        if tz is None or self.time.tzinfo is tz:
+            return self.time
+
+        return self.time.astimezone(tz)
+
+
+class CoarseClock(Clock):
+    def __init__(
+        self,
+        resolution: timedelta = timedelta(minutes=1),
+        source: Source = datetime.now,
+    ) -> None:
+        super().__init__(source)
+
+        self._resolution = resolution.total_seconds()
+        self._cached: tuple[float, tzinfo | None, datetime] | None = None
+
+    def now(self, tz: tzinfo | None = None) -> datetime:
+        cached = self._cached
+        monotonic = time.monotonic()
+
+        if cached is None or monotonic >= cached[0] or cached[1] is not tz:
+            cached = self._cached = (monotonic + self._resolution, tz, self._source(tz))
+
+        return cached[2]
@@ -0,0 +1,101 @@
+import threading
+from datetime import datetime, tzinfo
+from typing import Any
+
+from . import time_format
+from .clock import Clock
+from .now import Now, WeekStartDay
+from .time_format import TIME_FORMATS, ParseCache
+
+_SETTINGS = (
+    "week_start_day",
+    "time_zone",
+    "time_formats",
+    "parse_cache",
+    "resolve_time_zone",
+    "clock",
+)
+
+
+class Config:
+    __slots__ = tuple(f"_{name}" for name in _SETTINGS) + ("_local",)
+
+    def __init__(
+        self,
+        week_start_day: WeekStartDay = WeekStartDay.SUNDAY,
+        time_zone: tzinfo | None = None,
+        time_formats: list[str] | None = None,
+        parse_cache: ParseCache | None = None,
+        resolve_time_zone: bool = False,
+        clock: Clock | None = None,
+    ) -> None:
+        if time_formats is None:
+            time_formats = TIME_FORMATS
+        time_format.precompile(time_formats)
+
+        self._week_start_day: WeekStartDay = week_start_day
+        self._time_zone: tzinfo | None = time_zone
+        self._time_formats: list[str] = time_formats
+        self._parse_cache: ParseCache | None = parse_cache
+        self._resolve_time_zone: bool = resolve_time_zone
+        self._clock: Clock = clock or Clock()
+
+        self._local = threading.local()
+
+    def __repr__(self) -> str:
+        settings = ", ".join(f"{name}={getattr(self, name)!r}" for name in _SETTINGS)
+
+        return f"Config({settings})"
+
+    @property
+    def week_start_day(self) -> WeekStartDay:
+        return self._week_start_day
+
+    @property
+    def time_zone(self) -> tzinfo | None:
+        return self._time_zone
+
+    @property
+    def time_formats(self) -> list[str]:
+        return self._time_formats
+
+    @property
+    def parse_cache(self) -> ParseCache | None:
+        return self._parse_cache
+
+    @property
+    def resolve_time_zone(self) -> bool:
+        return self._resolve_time_zone
+
+    @property
+    def clock(self) -> Clock:
+        return self._clock
+
+    def replace(self, **changes: Any) -> "Config":
+        settings = {name: getattr(self, name) for name in _SETTINGS}
+        settings.update(changes)
+
+        return Config(**settings)
+
+    def now(self) -> datetime:
+        return self._clock.now(self._time_zone)
+
+    def with_(self, time: datetime | None = None) -> Now:
+        if time is None:
+            time = self.now()
+
+        return Now(
+            time=time,
+            time_formats=self._time_formats,
+            week_start_day=self._week_start_day,
+            parse_cache=self._parse_cache,
+            resolve_time_zone=self._resolve_time_zone,
+        )
+
+    def _state(self) -> threading.local:
+        local = self._local
+        if not hasattr(local, "now"):
+            local.now = self.with_()
+            local.boundaries = {}
+
+        return local
@@ -0,0 +1,243 @@
+import enum
+import functools
+import math
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Callable
+
+from .now import WeekStartDay
+from .time_format import _MICROSECOND
+
+
+class Unit(enum.IntEnum):
+    SECOND = 1_000_000
+    MICROSECOND = 1
+
+
+MINUTE = 60_000_000
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# 1970-01-01 was a Thursday, weekday 4 when counting from Sunday.
+EPOCH_WEEKDAY = 4
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def days_from_civil(year: int, month: int, day: int) -> int:
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+
+    return era * 146097 + day_of_era - 719468
+
+
+def civil_from_days(days: int) -> tuple[int, int, int]:
+    days += 719468
+    era = days // 146097
+    day_of_era = days - era * 146097
+    year_of_era = (
+        day_of_era - day_of_era // 1460 + day_of_era // 36524 - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (
+        365 * year_of_era + year_of_era // 4 - year_of_era // 100
+    )
+    shifted_month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * shifted_month + 2) // 5 + 1
+    month = shifted_month + (3 if shifted_month < 10 else -9)
+
+    return year_of_era + era * 400 + (month <= 2), month, day
+
+
+def _microseconds(timestamp: float, unit: Unit) -> int:
+    if isinstance(timestamp, int):
+        return timestamp * unit
+    if unit is Unit.MICROSECOND:
+        return round(timestamp)
+
+    # Round the same way as datetime.fromtimestamp.
+    fraction, seconds = math.modf(timestamp)
+    return int(seconds) * Unit.SECOND + round(fraction * Unit.SECOND)
+
+
+@functools.lru_cache()
+def _fixed_offset(tz: timezone) -> int:
+    return tz.utcoffset(None) // _MICROSECOND
+
+
+def _local(microseconds: int, tz: tzinfo) -> tuple[int, int]:
+    if isinstance(tz, timezone):
+        return microseconds + _fixed_offset(tz), 0
+
+    local = datetime.fromtimestamp(microseconds // Unit.SECOND, tz)
+    offset = local.utcoffset() or timedelta(0)
+
+    return microseconds + offset // _MICROSECOND, local.fold
+
+
+def _utc(local: int, tz: tzinfo, fold: int) -> int:
+    if isinstance(tz, timezone):
+        return local - _fixed_offset(tz)
+
+    wall = _EPOCH + timedelta(0, 0, local)
+    if fold:
+        wall = wall.replace(fold=fold)
+    offset = tz.utcoffset(wall) or timedelta(0)
+
+    return local - offset // _MICROSECOND
+
+
+def _boundary(
+    timestamp: float,
+    tz: tzinfo,
+    unit: Unit,
+    compute: Callable[[int, int], int],
+    argument: int,
+    keep_fold: bool = True,
+) -> float:
+    local, fold = _local(_microseconds(timestamp, unit), tz)
+    microseconds = _utc(compute(local, argument), tz, fold if keep_fold else 0)
+
+    if unit is Unit.MICROSECOND:
+        return microseconds
+    return microseconds / unit
+
+
+def _floor(local: int, size: int) -> int:
+    return local - local % size
+
+
+def _ceil(local: int, size: int) -> int:
+    return local - local % size + size - 1
+
+
+def _week_start(local: int, week_start_day: int) -> int:
+    days = local // DAY
+
+    return (days - (days + EPOCH_WEEKDAY - week_start_day) % 7) * DAY
+
+
+def _week_end(local: int, week_start_day: int) -> int:
+    return _week_start(local, week_start_day) + 7 * DAY - 1
+
+
+def _month_start(local: int, months: int) -> tuple[int, int]:
+    year, month, _ = civil_from_days(local // DAY)
+
+    return year, (month - 1) // months * months + 1
+
+
+def _months_start(local: int, months: int) -> int:
+    year, month = _month_start(local, months)
+
+    return days_from_civil(year, month, 1) * DAY
+
+
+def _months_end(local: int, months: int) -> int:
+    year, month = _month_start(local, months)
+    year, month = divmod(year * 12 + month - 1 + months, 12)
+
+    return days_from_civil(year, month + 1, 1) * DAY - 1
+
+
+def beginning_of_minute(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _floor, MINUTE)
+
+
+def beginning_of_hour(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _floor, HOUR)
+
+
+def beginning_of_day(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _floor, DAY)
+
+
+def beginning_of_week(
+    timestamp: float,
+    tz: tzinfo = timezone.utc,
+    unit: Unit = Unit.SECOND,
+    week_start_day: WeekStartDay = WeekStartDay.SUNDAY,
+) -> float:
+    return _boundary(timestamp, tz, unit, _week_start, week_start_day, False)
+
+
+def beginning_of_month(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _months_start, 1)
+
+
+def beginning_of_quarter(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _months_start, 3)
+
+
+def beginning_of_half(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _months_start, 6)
+
+
+def beginning_of_year(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _months_start, 12)
+
+
+def end_of_minute(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _ceil, MINUTE)
+
+
+def end_of_hour(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _ceil, HOUR)
+
+
+def end_of_day(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _ceil, DAY)
+
+
+def end_of_week(
+    timestamp: float,
+    tz: tzinfo = timezone.utc,
+    unit: Unit = Unit.SECOND,
+    week_start_day: WeekStartDay = WeekStartDay.SUNDAY,
+) -> float:
+    return _boundary(timestamp, tz, unit, _week_end, week_start_day, False)
+
+
+def end_of_month(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _months_end, 1)
+
+
+def end_of_quarter(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _months_end, 3)
+
+
+def end_of_half(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _months_end, 6)
+
+
+def end_of_year(
+    timestamp: float, tz: tzinfo = timezone.utc, unit: Unit = Unit.SECOND
+) -> float:
+    return _boundary(timestamp, tz, unit, _months_end, 12)
@@ -0,0 +1,169 @@
+import functools
+import re
+import sys
+from datetime import datetime, timedelta
+from types import ModuleType
+from typing import Any, Callable, Iterable, Iterator
+
+_PAD2 = [f"{number:02d}" for number in range(100)]
+_PAD4 = [f"{number:04d}" for number in range(10000)]
+
+_HOUR12 = [_PAD2[hour % 12 or 12] for hour in range(24)]
+_AM_PM = ["AM"] * 12 + ["PM"] * 12
+
+_WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+_FULL_WEEKDAYS = [
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+]
+_MONTHS = [
+    "",
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+]
+_FULL_MONTHS = [
+    "",
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+]
+
+
+def _offset(time: datetime) -> str:
+    offset = time.utcoffset()
+    if offset is None:
+        return ""
+
+    sign = "+"
+    if offset < timedelta(0):
+        sign, offset = "-", -offset
+
+    minutes, seconds = divmod(offset.seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    rendered = f"{sign}{_PAD2[offset.days * 24 + hours]}{_PAD2[minutes]}"
+
+    if seconds or offset.microseconds:
+        rendered += _PAD2[seconds]
+        if offset.microseconds:
+            rendered += f".{offset.microseconds:06d}"
+
+    return rendered
+
+
+def _zone(time: datetime) -> str:
+    return time.tzname() or ""
+
+
+_EXPRESSIONS = {
+    "Y": "_PAD4[t.year]",
+    "y": "_PAD2[t.year % 100]",
+    "m": "_PAD2[t.month]",
+    "d": "_PAD2[t.day]",
+    "H": "_PAD2[t.hour]",
+    "I": "_HOUR12[t.hour]",
+    "p": "_AM_PM[t.hour]",
+    "M": "_PAD2[t.minute]",
+    "S": "_PAD2[t.second]",
+    "f": "t.microsecond:06d",
+    "a": "_WEEKDAYS[t.weekday()]",
+    "A": "_FULL_WEEKDAYS[t.weekday()]",
+    "b": "_MONTHS[t.month]",
+    "B": "_FULL_MONTHS[t.month]",
+    "z": "_offset(t)",
+    "Z": "_zone(t)",
+}
+
+_NAMESPACE: dict[str, Any] = {
+    "_PAD2": _PAD2,
+    "_PAD4": _PAD4,
+    "_HOUR12": _HOUR12,
+    "_AM_PM": _AM_PM,
+    "_WEEKDAYS": _WEEKDAYS,
+    "_FULL_WEEKDAYS": _FULL_WEEKDAYS,
+    "_MONTHS": _MONTHS,
+    "_FULL_MONTHS": _FULL_MONTHS,
+    "_offset": _offset,
+    "_zone": _zone,
+}
+
+_DIRECTIVE = re.compile("%(.?)")
+
+
+@functools.lru_cache()
+def _renderer(time_format: str) -> Callable[[datetime], str]:
+    namespace = dict(_NAMESPACE)
+
+    fields: list[str] = []
+    position = 0
+    for directive in _DIRECTIVE.finditer(time_format):
+        literal = time_format[position : directive.start()]
+        code = directive.group(1)
+        if code == "%":
+            literal += "%"
+        position = directive.end()
+
+        if literal:
+            namespace[f"_l{len(fields)}"] = literal
+            fields.append(f"_l{len(fields)}")
+
+        if code in _EXPRESSIONS:
+            fields.append(_EXPRESSIONS[code])
+        elif code != "%":
+            # Anything without a table-driven renderer goes through strftime.
+            namespace[f"_l{len(fields)}"] = directive.group(0)
+            fields.append(f"t.strftime(_l{len(fields)})")
+
+    if position < len(time_format):
+        namespace[f"_l{len(fields)}"] = time_format[position:]
+        fields.append(f"_l{len(fields)}")
+
+    body = "".join(f"{{{field}}}" for field in fields)
+    exec(f"def render(t):\n    return f{body!r}\n", namespace)
+
+    return namespace["render"]
+
+
+def format(time: datetime, time_format: str) -> str:
+    return _renderer(time_format)(time)
+
+
+def format_many(
+    times: Iterable[datetime] | Any, time_format: str
+) -> Iterator[str] | Any:
+    render = _renderer(time_format)
+
+    np: ModuleType | None = sys.modules.get("numpy")
+    if np is not None and isinstance(times, np.ndarray) and times.dtype.kind == "M":
+        return np.array(
+            [
+                "NaT" if time is None else render(time)
+                for time in times.astype("datetime64[us]").tolist()
+            ],
+            dtype=str,
+        )
+
+    return map(render, times)
@@ -1,8 +1,10 @@
 import calendar
 import enum
-from datetime import datetime, timedelta
+import functools
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Iterable, Iterator, NamedTuple
 
-from . import time_format
+from . import formatter, time_format
 
 
 class Min(enum.IntEnum):
@@ -23,17 +25,81 @@ class Max(enum.IntEnum):
     MONTH = 12
 
 
+_DAY_START = (
+    time(Min.HOUR, Min.MINUTE, Min.SECOND, Min.MICROSECOND),
+    time(Min.HOUR, Min.MINUTE, Min.SECOND, Min.MICROSECOND, fold=1),
+)
+
+_DAY_END = (
+    time(Max.HOUR, Max.MINUTE, Max.SECOND, Max.MICROSECOND),
+    time(Max.HOUR, Max.MINUTE, Max.SECOND, Max.MICROSECOND, fold=1),
+)
+
+
 class WeekStartDay(enum.IntEnum):
     SUNDAY = 0
     MONDAY = 1
 
 
+class Period(str, enum.Enum):
+    MINUTE = "minute"
+    HOUR = "hour"
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    QUARTER = "quarter"
+    HALF = "half"
+    YEAR = "year"
+
+
+class _Calendar(NamedTuple):
+    day: date
+    fold: int
+    quarter: int
+    half: int
+    week_offset: int
+
+
+def _memoized(method: Callable[["Now"], datetime]) -> Callable[["Now"], datetime]:
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: "Now") -> datetime:
+        boundaries = self._boundaries
+        if boundaries is None:
+            boundaries = self._boundaries = {}
+        else:
+            boundary = boundaries.get(name)
+            if boundary is not None:
+                return boundary
+
+        boundary = boundaries[name] = method(self)
+
+        return boundary
+
+    return wrapper
+
+
 class Now:
+    __slots__ = (
+        "_time",
+        "_time_formats",
+        "_week_start_day",
+        "_adaptive",
+        "_parse_cache",
+        "_resolve_time_zone",
+        "_calendar",
+        "_boundaries",
+    )
+
     def __init__(
         self,
         time: datetime | None = None,
         time_formats: list[str] | None = None,
         week_start_day: WeekStartDay = WeekStartDay.SUNDAY,
+        adaptive: bool = False,
+        parse_cache: time_format.ParseCache | None = None,
+        resolve_time_zone: bool = False,
     ) -> None:
         if time is None:
             time = datetime.now()
@@ -45,6 +111,15 @@ class Now:
 
         self._week_start_day: WeekStartDay = week_start_day
 
+        self._adaptive: bool = adaptive
+
+        self._parse_cache: time_format.ParseCache | None = parse_cache
+
+        self._resolve_time_zone: bool = resolve_time_zone
+
+        self._calendar: _Calendar | None = None
+        self._boundaries: dict[str, datetime] | None = None
+
     def __str__(self) -> str:
         return str(self._time)
 
@@ -66,6 +141,48 @@ class Now:
 
         return timedelta(days=-week_start), timedelta(days=week_end - 1)
 
+    def _invalidate(self) -> None:
+        self._calendar = None
+        self._boundaries = None
+
+    def _decompose(self) -> _Calendar:
+        snapshot = self._calendar
+        if snapshot is None:
+            day = self._time.date()
+            month = self._time.month - 1
+            snapshot = self._calendar = _Calendar._make(
+                (
+                    day,
+                    self._time.fold,
+                    month // 3 + 1,
+                    month // 6 + 1,
+                    (day.isoweekday() - self._week_start_day) % 7,
+                )
+            )
+
+        return snapshot
+
+    def _resolved(self, period: Period) -> tuple[datetime, datetime] | None:
+        if not self._resolve_time_zone or self._time.tzinfo is None:
+            return None
+
+        from . import zone
+
+        return zone.bounds(self._time, period, self._week_start_day)
+
+    def _at(self, day: date, time_of_day: tuple[time, time], fold: int) -> datetime:
+        return datetime.combine(day, time_of_day[fold], self._time.tzinfo)
+
+    def _beginning_of_month(self, month: int) -> datetime:
+        day = date(self._time.year, month, Min.DAY)
+
+        return self._at(day, _DAY_START, self._time.fold)
+
+    def _end_of_month(self, month: int) -> datetime:
+        day = date(self._time.year, month, self._days_in_month(month))
+
+        return self._at(day, _DAY_END, self._time.fold)
+
     @property
     def time(self) -> datetime:
         return self._time
@@ -73,6 +190,7 @@ class Now:
     @time.setter
     def time(self, time: datetime) -> None:
         self._time = time
+        self._invalidate()
 
     @property
     def time_formats(self) -> list[str]:
@@ -89,6 +207,32 @@ class Now:
     @week_start_day.setter
     def week_start_day(self, week_start_day: WeekStartDay) -> None:
         self._week_start_day = week_start_day
+        self._invalidate()
+
+    @property
+    def adaptive(self) -> bool:
+        return self._adaptive
+
+    @adaptive.setter
+    def adaptive(self, adaptive: bool) -> None:
+        self._adaptive = adaptive
+
+    @property
+    def parse_cache(self) -> time_format.ParseCache | None:
+        return self._parse_cache
+
+    @parse_cache.setter
+    def parse_cache(self, parse_cache: time_format.ParseCache | None) -> None:
+        self._parse_cache = parse_cache
+
+    @property
+    def resolve_time_zone(self) -> bool:
+        return self._resolve_time_zone
+
+    @resolve_time_zone.setter
+    def resolve_time_zone(self, resolve_time_zone: bool) -> None:
+        self._resolve_time_zone = resolve_time_zone
+        self._invalidate()
 
     def quarter(self) -> int:
         return (self._time.month - 1) // 3 + 1
@@ -96,69 +240,135 @@ class Now:
     def half(self) -> int:
         return (self._time.month - 1) // 6 + 1
 
+    @_memoized
     def beginning_of_minute(self) -> datetime:
         return self._time.replace(second=Min.SECOND, microsecond=Min.MICROSECOND)
 
+    @_memoized
     def beginning_of_hour(self) -> datetime:
-        return self.beginning_of_minute().replace(minute=Min.MINUTE)
+        return self._time.replace(
+            minute=Min.MINUTE, second=Min.SECOND, microsecond=Min.MICROSECOND
+        )
 
+    @_memoized
     def beginning_of_day(self) -> datetime:
-        return self.beginning_of_hour().replace(hour=Min.HOUR)
+        resolved = self._resolved(Period.DAY)
+        if resolved is not None:
+            return resolved[0]
 
+        snapshot = self._decompose()
+
+        return self._at(snapshot.day, _DAY_START, snapshot.fold)
+
+    @_memoized
     def beginning_of_week(self) -> datetime:
-        days, _ = self._week_range(self._week_start_day)
+        resolved = self._resolved(Period.WEEK)
+        if resolved is not None:
+            return resolved[0]
+
+        snapshot = self._decompose()
+        week_start = snapshot.day - timedelta(days=snapshot.week_offset)
 
-        return self.beginning_of_day() + days
+        return self._at(week_start, _DAY_START, 0)
 
+    @_memoized
     def beginning_of_month(self) -> datetime:
-        return self.beginning_of_day().replace(day=Min.DAY)
+        resolved = self._resolved(Period.MONTH)
+        if resolved is not None:
+            return resolved[0]
 
+        return self._beginning_of_month(self._time.month)
+
+    @_memoized
     def beginning_of_quarter(self) -> datetime:
-        month = (self.quarter() - 1) * 3 + 1
+        resolved = self._resolved(Period.QUARTER)
+        if resolved is not None:
+            return resolved[0]
+
+        month = (self._decompose().quarter - 1) * 3 + 1
 
-        return self.beginning_of_month().replace(month=month)
+        return self._beginning_of_month(month)
 
+    @_memoized
     def beginning_of_half(self) -> datetime:
-        month = (self.half() - 1) * 6 + 1
+        resolved = self._resolved(Period.HALF)
+        if resolved is not None:
+            return resolved[0]
 
-        return self.beginning_of_month().replace(month=month)
+        month = (self._decompose().half - 1) * 6 + 1
 
+        return self._beginning_of_month(month)
+
+    @_memoized
     def beginning_of_year(self) -> datetime:
-        return self.beginning_of_month().replace(month=Min.MONTH)
+        resolved = self._resolved(Period.YEAR)
+        if resolved is not None:
+            return resolved[0]
+
+        return self._beginning_of_month(Min.MONTH)
 
+    @_memoized
     def end_of_minute(self) -> datetime:
         return self._time.replace(second=Max.SECOND, microsecond=Max.MICROSECOND)
 
+    @_memoized
     def end_of_hour(self) -> datetime:
-        return self.end_of_minute().replace(minute=Max.MINUTE)
+        return self._time.replace(
+            minute=Max.MINUTE, second=Max.SECOND, microsecond=Max.MICROSECOND
+        )
 
+    @_memoized
     def end_of_day(self) -> datetime:
-        return self.end_of_hour().replace(hour=Max.HOUR)
+        resolved = self._resolved(Period.DAY)
+        if resolved is not None:
+            return resolved[1]
 
+        snapshot = self._decompose()
+
+        return self._at(snapshot.day, _DAY_END, snapshot.fold)
+
+    @_memoized
     def end_of_week(self) -> datetime:
-        _, days = self._week_range(self._week_start_day)
+        resolved = self._resolved(Period.WEEK)
+        if resolved is not None:
+            return resolved[1]
+
+        snapshot = self._decompose()
+        week_end = snapshot.day + timedelta(days=6 - snapshot.week_offset)
 
-        return self.end_of_day() + days
+        return self._at(week_end, _DAY_END, 0)
 
+    @_memoized
     def end_of_month(self) -> datetime:
-        day = self._days_in_month(self._time.month)
+        resolved = self._resolved(Period.MONTH)
+        if resolved is not None:
+            return resolved[1]
 
-        return self.end_of_day().replace(day=day)
+        return self._end_of_month(self._time.month)
 
+    @_memoized
     def end_of_quarter(self) -> datetime:
-        month = self.quarter() * 3
-        day = self._days_in_month(month)
+        resolved = self._resolved(Period.QUARTER)
+        if resolved is not None:
+            return resolved[1]
 
-        return self.end_of_day().replace(month=month, day=day)
+        return self._end_of_month(self._decompose().quarter * 3)
 
+    @_memoized
     def end_of_half(self) -> datetime:
-        month = self.half() * 6
-        day = self._days_in_month(month)
+        resolved = self._resolved(Period.HALF)
+        if resolved is not None:
+            return resolved[1]
 
-        return self.end_of_day().replace(month=month, day=day)
+        return self._end_of_month(self._decompose().half * 6)
 
+    @_memoized
     def end_of_year(self) -> datetime:
-        return self.end_of_day().replace(month=Max.MONTH, day=Max.DAY)
+        resolved = self._resolved(Period.YEAR)
+        if resolved is not None:
+            return resolved[1]
+
+        return self._end_of_month(Max.MONTH)
 
     def sunday(self, time: str | None = None) -> datetime:
         if time is not None:
@@ -181,7 +391,28 @@ class Now:
         return parsed_time + days
 
     def parse(self, time: str) -> datetime:
-        return time_format.parse(time, self._time, self._time_formats)
+        if self._parse_cache is not None:
+            return self._parse_cache.parse(
+                time, self._time, self._time_formats, adaptive=self._adaptive
+            )
+
+        return time_format.parse(
+            time, self._time, self._time_formats, adaptive=self._adaptive
+        )
+
+    def try_parse(self, time: str, default: datetime | None = None) -> datetime | None:
+        return time_format.try_parse(
+            time, self._time, self._time_formats, self._adaptive, default
+        )
+
+    def parse_many(self, times: Iterable[str], utc: bool = False) -> Iterator[datetime]:
+        return time_format.parse_many(times, self._time, self._time_formats, utc)
+
+    def parse_many_epoch(self, times: Iterable[str]) -> Iterator[int]:
+        return time_format.parse_many_epoch(times, self._time, self._time_formats)
+
+    def format(self, time_format: str) -> str:
+        return formatter.format(self._time, time_format)
 
     def between(self, begin: str, end: str) -> bool:
         begin_time = self.parse(begin)
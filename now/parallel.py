@@ -0,0 +1,122 @@
+import array
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Iterator
+
+from . import time_format
+
+CHUNK_SIZE = 64 * 1024 * 1024
+
+
+def epoch_microseconds(time: datetime) -> int:
+    return time_format._epoch_microseconds(time)
+
+
+def _chunks(path: str, chunk_size: int) -> list[tuple[int, int]]:
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return []
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            chunks = []
+            start = 0
+            while start < size:
+                end = data.find(b"\n", min(start + chunk_size, size) - 1)
+                end = size if end == -1 else end + 1
+                chunks.append((start, end))
+                start = end
+
+    return chunks
+
+
+def _parse_chunk(
+    path: str,
+    start: int,
+    end: int,
+    default_time: datetime | None,
+    formats: list[str] | None,
+    invalid: int | None,
+) -> array.array:
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            lines = data[start:end].split(b"\n")
+
+    if lines[-1] == b"":
+        lines.pop()
+
+    result = array.array("q")
+    for number, line in enumerate(lines):
+        string = line.decode().rstrip("\r")
+
+        try:
+            time = time_format.parse(string, default_time, formats, adaptive=True)
+        except ValueError:
+            if invalid is None:
+                raise
+            result.append(invalid)
+        else:
+            result.append(epoch_microseconds(time))
+
+    return result
+
+
+def _parse_chunks(
+    path: str,
+    default_time: datetime | None,
+    formats: list[str] | None,
+    invalid: int | None,
+    workers: int | None,
+    chunk_size: int,
+) -> Iterator[array.array]:
+    chunks = _chunks(path, chunk_size)
+    arguments = [
+        (path, start, end, default_time, formats, invalid) for start, end in chunks
+    ]
+
+    if len(chunks) <= 1 or workers == 1:
+        for argument in arguments:
+            yield _parse_chunk(*argument)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_parse_chunk, *zip(*arguments))
+
+
+def parse_file(
+    path: str,
+    default_time: datetime | None = None,
+    formats: list[str] | None = None,
+    invalid: int | None = None,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> array.array:
+    result = array.array("q")
+    for chunk in _parse_chunks(
+        path, default_time, formats, invalid, workers, chunk_size
+    ):
+        result.extend(chunk)
+
+    return result
+
+
+def convert_file(
+    path: str,
+    output: str,
+    default_time: datetime | None = None,
+    formats: list[str] | None = None,
+    invalid: int | None = None,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> int:
+    count = 0
+    with open(output, "wb") as file:
+        for chunk in _parse_chunks(
+            path, default_time, formats, invalid, workers, chunk_size
+        ):
+            chunk.tofile(file)
+            count += len(chunk)
+
+    return count
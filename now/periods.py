@@ -0,0 +1,144 @@
+import calendar
+from datetime import datetime, tzinfo
+from typing import Callable, Iterator
+
+from .now import Max, Period, WeekStartDay
+
+Key = Callable[[datetime], int]
+
+
+def _week_key(week_start_day: WeekStartDay) -> Key:
+    def key(time: datetime) -> int:
+        ordinal = time.toordinal()
+        # toordinal() % 7 counts from Sunday, like Now._week_range.
+        return ordinal - (ordinal - week_start_day) % 7
+
+    return key
+
+
+_KEYS: dict[Period, Key] = {
+    Period.MINUTE: lambda time: (time.toordinal() * 24 + time.hour) * 60 + time.minute,
+    Period.HOUR: lambda time: time.toordinal() * 24 + time.hour,
+    Period.DAY: datetime.toordinal,
+    Period.MONTH: lambda time: time.year * 12 + time.month - 1,
+    Period.QUARTER: lambda time: time.year * 12 + (time.month - 1) // 3 * 3,
+    Period.HALF: lambda time: time.year * 12 + (time.month - 1) // 6 * 6,
+    Period.YEAR: lambda time: time.year * 12,
+}
+
+
+def period_key(
+    period: Period | str, week_start_day: WeekStartDay = WeekStartDay.SUNDAY
+) -> Key:
+    period = Period(period)
+    if period is Period.WEEK:
+        return _week_key(week_start_day)
+    return _KEYS[period]
+
+
+def period_start(period: Period | str, key: int, tz: tzinfo | None = None) -> datetime:
+    period = Period(period)
+    if period is Period.MINUTE:
+        days, minutes = divmod(key, 24 * 60)
+        return datetime.fromordinal(days).replace(
+            hour=minutes // 60, minute=minutes % 60, tzinfo=tz
+        )
+    if period is Period.HOUR:
+        days, hour = divmod(key, 24)
+        return datetime.fromordinal(days).replace(hour=hour, tzinfo=tz)
+    if period in (Period.DAY, Period.WEEK):
+        return datetime.fromordinal(key).replace(tzinfo=tz)
+
+    year, month = divmod(key, 12)
+    return datetime(year, month + 1, 1, tzinfo=tz)
+
+
+_STRIDES: dict[Period, int] = {
+    Period.MINUTE: 1,
+    Period.HOUR: 1,
+    Period.DAY: 1,
+    Period.WEEK: 7,
+    Period.MONTH: 1,
+    Period.QUARTER: 3,
+    Period.HALF: 6,
+    Period.YEAR: 12,
+}
+
+
+def period_end(period: Period | str, key: int, tz: tzinfo | None = None) -> datetime:
+    period = Period(period)
+    if period is Period.MINUTE:
+        return period_start(period, key, tz).replace(
+            second=Max.SECOND, microsecond=Max.MICROSECOND
+        )
+    if period is Period.HOUR:
+        return period_start(period, key, tz).replace(
+            minute=Max.MINUTE, second=Max.SECOND, microsecond=Max.MICROSECOND
+        )
+
+    last = key + _STRIDES[period] - 1
+    if period in (Period.DAY, Period.WEEK):
+        day = datetime.fromordinal(last)
+    else:
+        year, month = divmod(last, 12)
+        _, days = calendar.monthrange(year, month + 1)
+        day = datetime(year, month + 1, days)
+
+    return day.replace(
+        hour=Max.HOUR,
+        minute=Max.MINUTE,
+        second=Max.SECOND,
+        microsecond=Max.MICROSECOND,
+        tzinfo=tz,
+    )
+
+
+class Periods:
+    def __init__(
+        self,
+        start: datetime,
+        end: datetime,
+        unit: Period | str = Period.DAY,
+        week_start_day: WeekStartDay = WeekStartDay.SUNDAY,
+    ) -> None:
+        self._unit: Period = Period(unit)
+        self._week_start_day: WeekStartDay = week_start_day
+        self._tzinfo: tzinfo | None = start.tzinfo
+
+        self._key: Key = period_key(self._unit, week_start_day)
+        self._keys: range = range(
+            self._key(start), self._key(end) + 1, _STRIDES[self._unit]
+        )
+
+    def __repr__(self) -> str:
+        return f"<Periods {self._unit.value} x {len(self)}>"
+
+    @property
+    def unit(self) -> Period:
+        return self._unit
+
+    def _period(self, key: int) -> tuple[datetime, datetime]:
+        return (
+            period_start(self._unit, key, self._tzinfo),
+            period_end(self._unit, key, self._tzinfo),
+        )
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __getitem__(self, index: int) -> tuple[datetime, datetime]:
+        return self._period(self._keys[index])
+
+    def __iter__(self) -> Iterator[tuple[datetime, datetime]]:
+        for key in self._keys:
+            yield self._period(key)
+
+    def __reversed__(self) -> Iterator[tuple[datetime, datetime]]:
+        for key in reversed(self._keys):
+            yield self._period(key)
+
+    def __contains__(self, time: object) -> bool:
+        return isinstance(time, datetime) and self._key(time) in self._keys
+
+    def index(self, time: datetime) -> int:
+        return self._keys.index(self._key(time))
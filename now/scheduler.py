@@ -0,0 +1,186 @@
+import asyncio
+import heapq
+import inspect
+import itertools
+import math
+from datetime import datetime
+from typing import Any, Callable
+
+from .config import Config
+from .now import Now, Period
+from .time_format import _MICROSECOND
+
+Callback = Callable[[datetime], Any]
+
+_END_OF: dict[Period, Callable[[Now], datetime]] = {
+    Period.MINUTE: Now.end_of_minute,
+    Period.HOUR: Now.end_of_hour,
+    Period.DAY: Now.end_of_day,
+    Period.WEEK: Now.end_of_week,
+    Period.MONTH: Now.end_of_month,
+    Period.QUARTER: Now.end_of_quarter,
+    Period.HALF: Now.end_of_half,
+    Period.YEAR: Now.end_of_year,
+}
+
+
+class Subscription:
+    __slots__ = ("_scheduler", "_period", "_callback", "_cancelled")
+
+    def __init__(
+        self, scheduler: "Scheduler", period: Period, callback: Callback
+    ) -> None:
+        self._scheduler = scheduler
+        self._period = period
+        self._callback = callback
+        self._cancelled = False
+
+    @property
+    def period(self) -> Period:
+        return self._period
+
+    @property
+    def callback(self) -> Callback:
+        return self._callback
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        if not self._cancelled:
+            self._cancelled = True
+            self._scheduler._release()
+
+
+class Scheduler:
+    def __init__(self, config: Config | None = None) -> None:
+        if config is None:
+            from . import current_config
+
+            config = current_config()
+        self._config = config
+
+        self._heap: list[tuple[float, int, datetime, Subscription]] = []
+        self._counter = itertools.count()
+        self._active = 0
+
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_due = math.inf
+
+        self._tasks: set[asyncio.Future[Any]] = set()
+
+    @property
+    def config(self) -> Config:
+        return self._config
+
+    def __len__(self) -> int:
+        return self._active
+
+    def _next(self, period: Period, time: datetime) -> datetime:
+        return _END_OF[period](self._config.with_(time)) + _MICROSECOND
+
+    def _arm(self) -> None:
+        heap = self._heap
+        while heap and heap[0][3].cancelled:
+            heapq.heappop(heap)
+
+        due = heap[0][0] if heap else math.inf
+        if due == self._timer_due:
+            return
+
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._timer_due = due
+
+        if heap:
+            loop = asyncio.get_running_loop()
+            delay = max(due - self._config.now().timestamp(), 0)
+            self._timer = loop.call_at(loop.time() + delay, self._fire)
+
+    def _release(self) -> None:
+        self._active -= 1
+        if not self._active:
+            self._heap.clear()
+        self._arm()
+
+    def subscribe(self, period: Period | str, callback: Callback) -> Subscription:
+        subscription = Subscription(self, Period(period), callback)
+        boundary = self._next(subscription.period, self._config.now())
+
+        entry = (boundary.timestamp(), next(self._counter), boundary, subscription)
+        heapq.heappush(self._heap, entry)
+        self._active += 1
+        self._arm()
+
+        return subscription
+
+    async def wait(self, period: Period | str) -> datetime:
+        future = asyncio.get_running_loop().create_future()
+
+        def wake(boundary: datetime) -> None:
+            if not future.done():
+                future.set_result(boundary)
+
+        subscription = self.subscribe(period, wake)
+        try:
+            return await future
+        finally:
+            subscription.cancel()
+
+    def close(self) -> None:
+        for _, _, _, subscription in self._heap:
+            subscription._cancelled = True
+
+        self._heap.clear()
+        self._active = 0
+        self._arm()
+
+    def _fire(self) -> None:
+        limit = self._timer_due
+        self._timer = None
+        self._timer_due = math.inf
+
+        heap = self._heap
+        current = self._config.now()
+
+        due = []
+        while heap and heap[0][0] <= limit:
+            _, _, boundary, subscription = heapq.heappop(heap)
+            if not subscription.cancelled:
+                due.append((boundary, subscription))
+
+        following: dict[tuple[Period, datetime], tuple[float, datetime]] = {}
+        for boundary, subscription in due:
+            key = subscription.period, boundary
+            upcoming = following.get(key)
+            if upcoming is None:
+                time = self._next(subscription.period, max(boundary, current))
+                upcoming = following[key] = time.timestamp(), time
+
+            heapq.heappush(
+                heap, (upcoming[0], next(self._counter), upcoming[1], subscription)
+            )
+
+        self._arm()
+
+        loop = asyncio.get_running_loop()
+        for boundary, subscription in due:
+            if subscription.cancelled:
+                continue
+
+            try:
+                result = subscription.callback(boundary)
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+            except Exception as exception:
+                loop.call_exception_handler(
+                    {
+                        "message": "Exception in scheduler callback",
+                        "exception": exception,
+                        "subscription": subscription,
+                    }
+                )
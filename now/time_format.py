@@ -1,7 +1,19 @@
-import contextlib
+# _strptime has no stubs, but its TimeRE is the exact directive table that
+# datetime.strptime compiles, so the dispatcher can never disagree with it.
+import _strptime  # type: ignore[import-not-found]
 import enum
 import functools
-from datetime import datetime
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import Callable, Iterable, Iterator, NamedTuple, Protocol
+
+try:
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:  # Python < 3.11
+    import sre_parse
 
 
 class Time(enum.IntEnum):
@@ -76,39 +88,946 @@ def format_defaults(time_format: str) -> int:
     return defaults
 
 
-def parse(
-    string: str, default_time: datetime | None = None, formats: list[str] | None = None
-) -> datetime:
-    formats = formats or TIME_FORMATS
+_GROUP_NAME = re.compile(r"\(\?P<\w+>")
+
+
+class _LocaleTime(Protocol):
+    a_weekday: list[str]
+    f_weekday: list[str]
+    a_month: list[str]
+    f_month: list[str]
+    am_pm: list[str]
+    timezone: tuple[frozenset[str], ...]
+
+
+class _TimeRE(Protocol):
+    locale_time: _LocaleTime
+
+    def pattern(self, format: str) -> str: ...
+
+
+@functools.lru_cache(maxsize=1)
+def _time_re() -> _TimeRE:
+    time_re: _TimeRE = _strptime.TimeRE()
+
+    return time_re
+
+
+@functools.lru_cache()
+def _pattern(time_format: str) -> str:
+    try:
+        return _GROUP_NAME.sub("(?:", _time_re().pattern(time_format))
+    except (KeyError, ValueError):
+        return "(?!)"
+
+
+@functools.lru_cache()
+def _format_regex(time_format: str) -> re.Pattern[str]:
+    return re.compile(_pattern(time_format), re.IGNORECASE)
+
+
+@functools.lru_cache()
+def _dispatcher(formats: tuple[str, ...], start: int = 0) -> re.Pattern[str]:
+    alternatives = [
+        f"(?P<f{index}>{_pattern(formats[index])})"
+        for index in range(start, len(formats))
+    ]
+
+    return re.compile("|".join(alternatives) or "(?!)", re.IGNORECASE)
+
+
+_DIGIT = frozenset("0")
+_ALPHA = frozenset("a")
+_SPACE = frozenset(" ")
+
+_FIRST_CHARS: dict[str, frozenset[str]] = {
+    **dict.fromkeys("YmHIMSfyjUWwuGV", _DIGIT),
+    **dict.fromkeys("aAbBpZ", _ALPHA),
+    "d": _DIGIT | _SPACE,
+    "z": frozenset("+-") | _ALPHA,
+    "%": frozenset("%"),
+}
+
+
+def _first_chars(time_format: str) -> frozenset[str] | None:
+    if not time_format:
+        return frozenset([""])
+    if time_format[0] == "%":
+        return _FIRST_CHARS.get(time_format[1:2])
+    if time_format[0].isspace():
+        return _SPACE
+    if time_format[0].isdigit():
+        return _DIGIT
+    if time_format[0].isalpha():
+        return _ALPHA
+    return frozenset(time_format[0])
+
+
+def _disjoint(format_a: str, format_b: str) -> bool:
+    first_a, first_b = _first_chars(format_a), _first_chars(format_b)
+    if first_a is not None and first_b is not None and not first_a & first_b:
+        return True
+
+    min_a, max_a = sre_parse.parse(_pattern(format_a)).getwidth()
+    min_b, max_b = sre_parse.parse(_pattern(format_b)).getwidth()
+
+    return max_a < min_b or max_b < min_a
+
+
+@functools.lru_cache()
+def _precedence_guard(formats: tuple[str, ...], index: int) -> re.Pattern[str] | None:
+    alternatives = [
+        _pattern(time_format)
+        for time_format in formats[:index]
+        if not _disjoint(time_format, formats[index])
+    ]
+    if not alternatives:
+        return None
+
+    return re.compile("|".join(alternatives), re.IGNORECASE)
+
+
+_ASCII_LETTERS = bytes(range(ord("A"), ord("Z") + 1)) + bytes(
+    range(ord("a"), ord("z") + 1)
+)
+
+_NO_LETTERS = frozenset("dmyYHIMSfjUWwuGV%")
+
+
+def _max_letters(time_format: str) -> float:
+    locale_time = _time_re().locale_time
+    names = {
+        "a": locale_time.a_weekday,
+        "A": locale_time.f_weekday,
+        "b": locale_time.a_month,
+        "B": locale_time.f_month,
+        "p": locale_time.am_pm,
+        "Z": [name for names in locale_time.timezone for name in names],
+        "z": ["Z"],
+    }
+
+    letters = 0.0
+    codes = iter(time_format)
+    for char in codes:
+        if char != "%":
+            letters += char.isalpha()
+            continue
+
+        code = next(codes, "")
+        if code in names:
+            letters += max(map(len, names[code]), default=0)
+        elif code not in _NO_LETTERS:
+            return float("inf")
+
+    return letters
+
+
+def _char_class(char: str) -> str:
+    if char.isdigit():
+        return "0"
+    if char.isalpha():
+        return "a"
+    if char.isspace():
+        return " "
+    return char
+
+
+Limits = tuple[int, int, float]
+
+
+@functools.lru_cache()
+def _prefilter(formats: tuple[str, ...]) -> dict[str | None, Limits]:
+    limits: dict[str | None, Limits] = {}
 
     for time_format in formats:
+        min_length, max_length = sre_parse.parse(_pattern(time_format)).getwidth()
+        letters = _max_letters(time_format)
+
+        for char in _first_chars(time_format) or [None]:
+            low, high, most = limits.get(char, (min_length, max_length, letters))
+            limits[char] = (
+                min(low, min_length),
+                max(high, max_length),
+                max(most, letters),
+            )
+
+    # Formats with an unknown first character can start with anything.
+    wildcard = limits.get(None)
+    if wildcard is not None:
+        for char, (low, high, most) in limits.items():
+            limits[char] = (
+                min(low, wildcard[0]),
+                max(high, wildcard[1]),
+                max(most, wildcard[2]),
+            )
+
+    return limits
+
+
+def _impossible(string: str, formats: tuple[str, ...]) -> bool:
+    limits = _prefilter(formats)
+    bounds = limits.get(_char_class(string[:1])) or limits.get(None)
+    if bounds is None:
+        return True
+
+    min_length, max_length, max_letters = bounds
+    if not min_length <= len(string) <= max_length:
+        return True
+
+    encoded = string.encode()
+    return len(encoded) - len(encoded.translate(None, _ASCII_LETTERS)) > max_letters
+
+
+_lanes: dict[tuple[str, ...], int] = {}
+
+
+_WHITESPACE = " \t\n\r\x0b\x0c"
+
+
+@functools.lru_cache(maxsize=4096)
+def _timezone(seconds: int, microseconds: int = 0, name: str | None = None) -> timezone:
+    offset = timedelta(seconds=seconds, microseconds=microseconds)
+
+    return timezone(offset, name) if name else timezone(offset)
+
+
+def _parse_date(string: str, sep: str) -> datetime | None:
+    if len(string) != 10 or string[4] != sep or string[7] != sep:
+        return None
 
-        with contextlib.suppress(ValueError):
-            time = datetime.strptime(string, time_format)
-
-            if not default_time:
-                return time
-
-            defaults = format_defaults(time_format)
-
-            if defaults:
-                if defaults & Time.YEAR:
-                    time = time.replace(year=default_time.year)
-                if defaults & Time.MONTH:
-                    time = time.replace(month=default_time.month)
-                if defaults & Time.DAY:
-                    time = time.replace(day=default_time.day)
-                if defaults & Time.HOUR:
-                    time = time.replace(hour=default_time.hour)
-                if defaults & Time.MINUTE:
-                    time = time.replace(minute=default_time.minute)
-                if defaults & Time.SECOND:
-                    time = time.replace(second=default_time.second)
-                if defaults & Time.MICROSECOND:
-                    time = time.replace(microsecond=default_time.microsecond)
-                if defaults & Time.TZINFO:
-                    time = time.replace(tzinfo=default_time.tzinfo)
+    return datetime(int(string[:4]), int(string[5:7]), int(string[8:10]))
 
+
+def _parse_date_time(
+    string: str,
+    date_sep: str,
+    time_seps: str,
+    microsecond: int = 0,
+    tzinfo: timezone | None = None,
+) -> datetime | None:
+    if (
+        string[4] != date_sep
+        or string[7] != date_sep
+        or string[10] not in time_seps
+        or string[13] != ":"
+        or string[16] != ":"
+    ):
+        return None
+
+    return datetime(
+        int(string[:4]),
+        int(string[5:7]),
+        int(string[8:10]),
+        int(string[11:13]),
+        int(string[14:16]),
+        int(string[17:19]),
+        microsecond,
+        tzinfo,
+    )
+
+
+def _parse_ymd_hms(string: str) -> datetime | None:
+    if len(string) != 19:
+        return None
+
+    return _parse_date_time(string, "-", _WHITESPACE)
+
+
+def _parse_ymd_hms_f(string: str) -> datetime | None:
+    if not 21 <= len(string) <= 26 or string[19] != ".":
+        return None
+
+    microsecond = int(string[20:].ljust(6, "0"))
+
+    return _parse_date_time(string, ".", _WHITESPACE, microsecond)
+
+
+def _ymd_hms_z_seconds(string: str) -> int | None:
+    if not 21 <= len(string) <= 26 or string[19] not in "Zz":
+        return None
+
+    offset = string[20:]
+    if offset == "Z":
+        return 0
+
+    if len(offset) == 6 and offset[3] == ":":
+        offset = offset[:3] + offset[4:]
+    if len(offset) != 5 or offset[0] not in "+-":
+        return None
+
+    seconds = int(offset[1:3]) * 3600 + int(offset[3:5]) * 60
+
+    return -seconds if offset[0] == "-" else seconds
+
+
+def _parse_ymd_hms_z(string: str) -> datetime | None:
+    seconds = _ymd_hms_z_seconds(string)
+    if seconds is None:
+        return None
+
+    return _parse_date_time(string, "-", "Tt", tzinfo=_timezone(seconds))
+
+
+def _parse_ymd_hms_z_wall(string: str) -> tuple[datetime, timedelta | None] | None:
+    seconds = _ymd_hms_z_seconds(string)
+    if seconds is None:
+        return None
+
+    time = _parse_date_time(string, "-", "Tt")
+    if time is None:
+        return None
+
+    return time, _timezone(seconds).utcoffset(None)
+
+
+def _parse_ymd(string: str) -> datetime | None:
+    if len(string) != 8:
+        return None
+
+    return datetime(int(string[:4]), int(string[4:6]), int(string[6:8]))
+
+
+_FAST_PATHS: dict[str, Callable[[str], datetime | None]] = {
+    "%Y-%m-%d %H:%M:%S": _parse_ymd_hms,
+    "%Y-%m-%dT%H:%M:%SZ%z": _parse_ymd_hms_z,
+    "%Y%m%d": _parse_ymd,
+    "%Y/%m/%d": lambda string: _parse_date(string, "/"),
+    "%Y.%m.%d %H:%M:%S.%f": _parse_ymd_hms_f,
+}
+
+_WALL_PATHS: dict[str, Callable[[str], tuple[datetime, timedelta | None] | None]] = {
+    "%Y-%m-%dT%H:%M:%SZ%z": _parse_ymd_hms_z_wall,
+}
+
+
+_FIELD_DIRECTIVES = {
+    "year": "Yy",
+    "month": "mbB",
+    "day": "d",
+    "hour": "HI",
+    "minute": "M",
+    "second": "S",
+    "microsecond": "f",
+    "offset": "z",
+    "zone": "Z",
+    "weekday": "aA",
+    "am_pm": "p",
+}
+
+_DIRECTIVES = frozenset("".join(_FIELD_DIRECTIVES.values()) + "%")
+
+_Fields = tuple[int, int, int, int, int, int, int]
+
+
+class _Parser:
+    __slots__ = ("_time_format", "_regex", "_months", "_am_pm")
+
+    def __init__(self, time_format: str, regex: re.Pattern[str]) -> None:
+        locale_time = _time_re().locale_time
+
+        self._time_format = time_format
+        self._regex = regex
+        self._months = {
+            name: month
+            for names in (locale_time.a_month, locale_time.f_month)
+            for month, name in enumerate(names)
+            if name
+        }
+        self._am_pm = tuple(locale_time.am_pm)
+
+    def __call__(self, string: str) -> datetime:
+        fields, tzinfo = self._fields(string)
+
+        return datetime(*fields, tzinfo)
+
+    def wall(self, string: str) -> tuple[datetime, timedelta | None]:
+        fields, tzinfo = self._fields(string)
+
+        return datetime(*fields), None if tzinfo is None else tzinfo.utcoffset(None)
+
+    def _fields(self, string: str) -> tuple[_Fields, timezone | None]:
+        found = self._regex.match(string)
+        if found is None or found.end() != len(string):
+            raise ValueError(
+                f"time data {string!r} does not match format {self._time_format!r}"
+            )
+
+        fields = found.groupdict()
+        get = fields.get
+
+        year = 1900
+        if (value := get("Y")) is not None:
+            year = int(value)
+        elif (value := get("y")) is not None:
+            year = int(value)
+            year += 2000 if year <= 68 else 1900
+
+        month = 1
+        if (value := get("m")) is not None:
+            month = int(value)
+        elif (value := get("b") or get("B")) is not None:
+            month = self._months[value.lower()]
+
+        hour = 0
+        if (value := get("H")) is not None:
+            hour = int(value)
+        elif (value := get("I")) is not None:
+            hour = int(value)
+            am_pm = (get("p") or "").lower()
+            if am_pm in ("", self._am_pm[0]):
+                if hour == 12:
+                    hour = 0
+            elif am_pm == self._am_pm[1] and hour != 12:
+                hour += 12
+
+        tzinfo = None
+        if (value := get("z")) is not None:
+            tzinfo = _offset(value, get("Z"))
+
+        fraction = get("f")
+
+        return (
+            year,
+            month,
+            int(get("d") or 1),
+            hour,
+            int(get("M") or 0),
+            int(get("S") or 0),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+        ), tzinfo
+
+
+def _offset(offset: str, name: str | None) -> timezone:
+    if offset == "Z":
+        seconds, microseconds = 0, 0
+    else:
+        if offset[3] == ":":
+            offset = offset[:3] + offset[4:]
+            if len(offset) > 5:
+                if offset[5] != ":":
+                    raise ValueError(f"Inconsistent use of : in {offset}")
+                offset = offset[:5] + offset[6:]
+
+        seconds = (
+            int(offset[1:3]) * 3600 + int(offset[3:5]) * 60 + int(offset[5:7] or 0)
+        )
+        microseconds = int(offset[8:].ljust(6, "0"))
+        if offset[0] == "-":
+            seconds, microseconds = -seconds, -microseconds
+
+    return _timezone(seconds, microseconds, name or None)
+
+
+@functools.lru_cache()
+def _compile(time_format: str) -> Callable[[str], datetime]:
+    codes = re.findall("%(.?)", time_format)
+    supported = _DIRECTIVES.issuperset(codes) and all(
+        sum(code in directives for code in codes) <= 1
+        for directives in _FIELD_DIRECTIVES.values()
+    )
+
+    if supported:
+        try:
+            regex = re.compile(_time_re().pattern(time_format), re.IGNORECASE)
+        except (KeyError, ValueError, re.error):
+            pass
+        else:
+            return _Parser(time_format, regex)
+
+    return lambda string: datetime.strptime(string, time_format)
+
+
+def _strptime_fast(string: str, time_format: str) -> datetime:
+    fast_path = _FAST_PATHS.get(time_format)
+
+    if fast_path is not None:
+        time = fast_path(string)
+        if time is not None:
             return time
 
-    raise ValueError(f"Can't parse string as time: {string!r}")
+    return _compile(time_format)(string)
+
+
+def _strptime_wall(string: str, time_format: str) -> tuple[datetime, timedelta | None]:
+    wall_path = _WALL_PATHS.get(time_format)
+    if wall_path is not None:
+        found = wall_path(string)
+        if found is not None:
+            return found
+    elif (fast_path := _FAST_PATHS.get(time_format)) is not None:
+        time = fast_path(string)
+        if time is not None:
+            return time, None
+
+    parser = _compile(time_format)
+    if isinstance(parser, _Parser):
+        return parser.wall(string)
+
+    time = parser(string)
+    offset = time.utcoffset()
+
+    return (time, None) if offset is None else (time.replace(tzinfo=None), offset)
+
+
+def precompile(formats: Iterable[str]) -> None:
+    formats_key = tuple(formats)
+
+    _dispatcher(formats_key)
+    _prefilter(formats_key)
+    for time_format in formats_key:
+        format_defaults(time_format)
+        _compile(time_format)
+
+
+class FormatStats(NamedTuple):
+    attempts: int
+    successes: int
+    failures: int
+    seconds: float
+
+
+class ParseStats(NamedTuple):
+    formats: dict[str, FormatStats]
+    rejections: int
+
+
+class ParseEvent(NamedTuple):
+    string: str
+    time_format: str | None
+    success: bool
+    seconds: float
+
+
+Hook = Callable[[ParseEvent], None]
+
+
+class _Stats:
+    def __init__(self, hook: Hook | None = None) -> None:
+        self.hook = hook
+
+        self._lock = threading.Lock()
+        self._formats: dict[str, list[float]] = {}
+        self._rejections: int = 0
+
+    def _record(
+        self, string: str, time_format: str, success: bool, seconds: float
+    ) -> None:
+        with self._lock:
+            counters = self._formats.setdefault(time_format, [0, 0, 0, 0.0])
+            counters[0] += 1
+            counters[1 if success else 2] += 1
+            counters[3] += seconds
+
+        if self.hook is not None:
+            self.hook(ParseEvent(string, time_format, success, seconds))
+
+    def attempt(
+        self,
+        string: str,
+        time_format: str,
+        default_time: datetime | None = None,
+        utc: bool = False,
+    ) -> datetime:
+        start = perf_counter()
+        try:
+            time = _strptime_defaults(string, time_format, default_time, utc)
+        except ValueError:
+            self._record(string, time_format, False, perf_counter() - start)
+            raise
+
+        self._record(string, time_format, True, perf_counter() - start)
+
+        return time
+
+    def reject(self, string: str) -> None:
+        with self._lock:
+            self._rejections += 1
+
+        if self.hook is not None:
+            self.hook(ParseEvent(string, None, False, 0.0))
+
+    def snapshot(self) -> ParseStats:
+        with self._lock:
+            formats = {
+                time_format: FormatStats(int(a), int(s), int(f), seconds)
+                for time_format, (a, s, f, seconds) in self._formats.items()
+            }
+            return ParseStats(formats, self._rejections)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._formats.clear()
+            self._rejections = 0
+
+
+_stats: _Stats | None = None
+
+
+def enable_stats(hook: Hook | None = None) -> None:
+    global _stats
+
+    if _stats is None:
+        _stats = _Stats(hook)
+    else:
+        _stats.hook = hook
+
+
+def disable_stats() -> None:
+    global _stats
+
+    _stats = None
+
+
+def stats() -> ParseStats:
+    recorder = _stats
+    if recorder is None:
+        return ParseStats({}, 0)
+
+    return recorder.snapshot()
+
+
+def reset_stats() -> None:
+    recorder = _stats
+    if recorder is not None:
+        recorder.reset()
+
+
+_DEFAULT_FIELDS = [
+    (Time.YEAR, "year"),
+    (Time.MONTH, "month"),
+    (Time.DAY, "day"),
+    (Time.HOUR, "hour"),
+    (Time.MINUTE, "minute"),
+    (Time.SECOND, "second"),
+    (Time.MICROSECOND, "microsecond"),
+    (Time.TZINFO, "tzinfo"),
+]
+
+
+def _apply_defaults(time: datetime, defaults: int, default_time: datetime) -> datetime:
+    if not defaults:
+        return time
+
+    return time.replace(
+        **{
+            name: getattr(default_time, name)
+            for field, name in _DEFAULT_FIELDS
+            if defaults & field
+        }
+    )
+
+
+_EPOCH_ORDINAL = 719163
+
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_microseconds(time: datetime) -> int:
+    seconds = (
+        (time.toordinal() - _EPOCH_ORDINAL) * 86400
+        + time.hour * 3600
+        + time.minute * 60
+        + time.second
+    )
+    microseconds = seconds * 1_000_000 + time.microsecond
+
+    offset = time.utcoffset()
+    if offset is not None:
+        microseconds -= offset // _MICROSECOND
+
+    return microseconds
+
+
+def _strptime_utc(
+    string: str, time_format: str, default_time: datetime | None
+) -> datetime:
+    time, offset = _strptime_wall(string, time_format)
+
+    if default_time:
+        defaults = format_defaults(time_format)
+        time = _apply_defaults(time, defaults & ~Time.TZINFO, default_time)
+
+        tzinfo = default_time.tzinfo
+        if defaults & Time.TZINFO and tzinfo is not None:
+            offset = tzinfo.utcoffset(time)
+
+    return time - offset if offset else time
+
+
+def _strptime_defaults(
+    string: str, time_format: str, default_time: datetime | None, utc: bool = False
+) -> datetime:
+    if utc:
+        return _strptime_utc(string, time_format, default_time)
+
+    time = _strptime_fast(string, time_format)
+    if not default_time:
+        return time
+
+    return _apply_defaults(time, format_defaults(time_format), default_time)
+
+
+def _attempt(
+    string: str, time_format: str, default_time: datetime | None, utc: bool = False
+) -> datetime:
+    recorder = _stats
+    if recorder is None:
+        return _strptime_defaults(string, time_format, default_time, utc)
+
+    return recorder.attempt(string, time_format, default_time, utc)
+
+
+def _search(
+    string: str,
+    formats: tuple[str, ...],
+    default_time: datetime | None = None,
+    utc: bool = False,
+) -> tuple[int, datetime] | None:
+    start = 0
+    while match := _dispatcher(formats, start).fullmatch(string):
+        index = int(match.lastgroup[1:])  # type: ignore[index]
+
+        try:
+            return index, _attempt(string, formats[index], default_time, utc)
+        except ValueError:
+            start = index + 1
+
+    recorder = _stats
+    if recorder is not None:
+        recorder.reject(string)
+
+    return None
+
+
+def _match(
+    string: str,
+    formats: tuple[str, ...],
+    default_time: datetime | None = None,
+    utc: bool = False,
+) -> tuple[int, datetime]:
+    found = _search(string, formats, default_time, utc)
+    if found is None:
+        raise ValueError(f"Can't parse string as time: {string!r}")
+
+    return found
+
+
+def _match_lane(
+    string: str,
+    formats: tuple[str, ...],
+    index: int,
+    default_time: datetime | None = None,
+    utc: bool = False,
+) -> datetime | None:
+    if not _format_regex(formats[index]).fullmatch(string):
+        return None
+
+    guard = _precedence_guard(formats, index)
+    if guard is not None and guard.fullmatch(string):
+        return None
+
+    try:
+        return _attempt(string, formats[index], default_time, utc)
+    except ValueError:
+        return None
+
+
+def _find(
+    string: str,
+    formats: tuple[str, ...],
+    adaptive: bool = False,
+    default_time: datetime | None = None,
+) -> tuple[int, datetime] | None:
+    lane = _lanes.get(formats) if adaptive else None
+
+    if lane is not None and (time := _match_lane(string, formats, lane, default_time)):
+        return lane, time
+
+    found = _search(string, formats, default_time)
+    if found is not None and adaptive:
+        _lanes[formats] = found[0]
+
+    return found
+
+
+def _parse(
+    string: str,
+    formats: tuple[str, ...],
+    adaptive: bool = False,
+    default_time: datetime | None = None,
+) -> tuple[int, datetime]:
+    found = _find(string, formats, adaptive, default_time)
+    if found is None:
+        raise ValueError(f"Can't parse string as time: {string!r}")
+
+    return found
+
+
+def parse(
+    string: str,
+    default_time: datetime | None = None,
+    formats: list[str] | None = None,
+    adaptive: bool = False,
+) -> datetime:
+    formats_key = tuple(formats or TIME_FORMATS)
+
+    _, time = _parse(string, formats_key, adaptive, default_time)
+
+    return time
+
+
+def try_parse(
+    string: str,
+    default_time: datetime | None = None,
+    formats: list[str] | None = None,
+    adaptive: bool = False,
+    default: datetime | None = None,
+) -> datetime | None:
+    formats_key = tuple(formats or TIME_FORMATS)
+
+    if _impossible(string, formats_key):
+        recorder = _stats
+        if recorder is not None:
+            recorder.reject(string)
+        return default
+
+    found = _find(string, formats_key, adaptive, default_time)
+    if found is None:
+        return default
+
+    _, time = found
+
+    return time
+
+
+def _parse_many(
+    strings: Iterable[str],
+    default_time: datetime | None,
+    formats: list[str] | None,
+    utc: bool,
+) -> Iterator[datetime]:
+    formats_key = tuple(formats or TIME_FORMATS)
+
+    lane = None
+    for string in strings:
+        if (
+            lane is None
+            or (time := _match_lane(string, formats_key, lane, default_time, utc))
+            is None
+        ):
+            lane, time = _match(string, formats_key, default_time, utc)
+
+        yield time
+
+
+def parse_many(
+    strings: Iterable[str],
+    default_time: datetime | None = None,
+    formats: list[str] | None = None,
+    utc: bool = False,
+) -> Iterator[datetime]:
+    return _parse_many(strings, default_time, formats, utc)
+
+
+def parse_many_epoch(
+    strings: Iterable[str],
+    default_time: datetime | None = None,
+    formats: list[str] | None = None,
+) -> Iterator[int]:
+    return map(_epoch_microseconds, _parse_many(strings, default_time, formats, True))
+
+
+class Eviction(enum.Enum):
+    LRU = "lru"
+    FIFO = "fifo"
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _CacheEntry(NamedTuple):
+    defaults: int
+    time: datetime
+    fields: tuple[object, ...] | None = None
+    result: datetime | None = None
+
+
+def _default_fields(defaults: int, default_time: datetime) -> tuple[object, ...]:
+    return tuple(
+        getattr(default_time, name)
+        for field, name in _DEFAULT_FIELDS
+        if defaults & field
+    )
+
+
+class ParseCache:
+    def __init__(self, maxsize: int = 1024, eviction: Eviction = Eviction.LRU) -> None:
+        self._maxsize: int = maxsize
+        self._eviction: Eviction = eviction
+
+        self._entries: OrderedDict[tuple[str, tuple[str, ...]], _CacheEntry]
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def _store(self, key: tuple[str, tuple[str, ...]], entry: _CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def parse(
+        self,
+        string: str,
+        default_time: datetime | None = None,
+        formats: list[str] | None = None,
+        adaptive: bool = False,
+    ) -> datetime:
+        formats_key = tuple(formats or TIME_FORMATS)
+        key = (string, formats_key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                if self._eviction is Eviction.LRU:
+                    self._entries.move_to_end(key)
+
+        if entry is None:
+            index, time = _parse(string, formats_key, adaptive)
+            entry = _CacheEntry(format_defaults(formats_key[index]), time)
+            self._store(key, entry)
+
+        if not default_time:
+            return entry.time
+
+        fields = _default_fields(entry.defaults, default_time)
+        if entry.fields == fields and entry.result is not None:
+            return entry.result
+
+        try:
+            result = _apply_defaults(entry.time, entry.defaults, default_time)
+        except ValueError:
+            return parse(string, default_time, list(formats_key), adaptive)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries[key] = entry._replace(fields=fields, result=result)
+
+        return result
@@ -0,0 +1,402 @@
+import functools
+import re
+from datetime import datetime
+
+import numpy as np
+import numpy.typing as npt
+
+from .epoch import EPOCH_WEEKDAY
+from .now import Max, WeekStartDay
+from .time_format import TIME_FORMATS, Time, _pattern, format_defaults
+from .time_format import parse as parse_time
+
+_UNIT = "datetime64[us]"
+
+# Periods end one tick before the next one begins, i.e. at Max.MICROSECOND.
+_TICK = np.timedelta64(1_000_000 - Max.MICROSECOND, "us")
+
+_WEEK = np.timedelta64(7, "D")
+
+
+def _to_us(times: npt.ArrayLike) -> np.ndarray:
+    return np.asarray(times).astype(_UNIT)
+
+
+def _keep_nat(times: np.ndarray, result: np.ndarray) -> np.ndarray:
+    nat = np.isnat(times)
+    if nat.any():
+        result[nat] = np.datetime64("NaT")
+    return result
+
+
+def _truncate(times: npt.ArrayLike, unit: str) -> np.ndarray:
+    return _to_us(times).astype(f"datetime64[{unit}]").astype(_UNIT)
+
+
+def _truncate_months(times: npt.ArrayLike, months: int) -> np.ndarray:
+    times = _to_us(times)
+    count = times.astype("datetime64[M]").astype(np.int64)
+    result = (count - count % months).astype("datetime64[M]").astype(_UNIT)
+    return _keep_nat(times, result)
+
+
+def _months_later(times: np.ndarray, months: int) -> np.ndarray:
+    return (times.astype("datetime64[M]") + np.timedelta64(months, "M")).astype(_UNIT)
+
+
+def beginning_of_minute(times: npt.ArrayLike) -> np.ndarray:
+    return _truncate(times, "m")
+
+
+def beginning_of_hour(times: npt.ArrayLike) -> np.ndarray:
+    return _truncate(times, "h")
+
+
+def beginning_of_day(times: npt.ArrayLike) -> np.ndarray:
+    return _truncate(times, "D")
+
+
+def beginning_of_week(
+    times: npt.ArrayLike, week_start_day: WeekStartDay = WeekStartDay.SUNDAY
+) -> np.ndarray:
+    times = _to_us(times)
+    days = times.astype("datetime64[D]").astype(np.int64)
+    days -= (days + EPOCH_WEEKDAY - week_start_day) % 7
+    return _keep_nat(times, days.astype("datetime64[D]").astype(_UNIT))
+
+
+def beginning_of_month(times: npt.ArrayLike) -> np.ndarray:
+    return _truncate(times, "M")
+
+
+def beginning_of_quarter(times: npt.ArrayLike) -> np.ndarray:
+    return _truncate_months(times, 3)
+
+
+def beginning_of_half(times: npt.ArrayLike) -> np.ndarray:
+    return _truncate_months(times, 6)
+
+
+def beginning_of_year(times: npt.ArrayLike) -> np.ndarray:
+    return _truncate(times, "Y")
+
+
+def end_of_minute(times: npt.ArrayLike) -> np.ndarray:
+    return beginning_of_minute(times) + np.timedelta64(1, "m") - _TICK
+
+
+def end_of_hour(times: npt.ArrayLike) -> np.ndarray:
+    return beginning_of_hour(times) + np.timedelta64(1, "h") - _TICK
+
+
+def end_of_day(times: npt.ArrayLike) -> np.ndarray:
+    return beginning_of_day(times) + np.timedelta64(1, "D") - _TICK
+
+
+def end_of_week(
+    times: npt.ArrayLike, week_start_day: WeekStartDay = WeekStartDay.SUNDAY
+) -> np.ndarray:
+    return beginning_of_week(times, week_start_day) + _WEEK - _TICK
+
+
+def end_of_month(times: npt.ArrayLike) -> np.ndarray:
+    return _months_later(beginning_of_month(times), 1) - _TICK
+
+
+def end_of_quarter(times: npt.ArrayLike) -> np.ndarray:
+    return _months_later(beginning_of_quarter(times), 3) - _TICK
+
+
+def end_of_half(times: npt.ArrayLike) -> np.ndarray:
+    return _months_later(beginning_of_half(times), 6) - _TICK
+
+
+def end_of_year(times: npt.ArrayLike) -> np.ndarray:
+    return _months_later(beginning_of_year(times), 12) - _TICK
+
+
+Field = tuple[str, int, int]
+
+_FIELDS: dict[str, tuple[str, int]] = {
+    "Y": ("year", 4),
+    "y": ("short_year", 2),
+    "m": ("month", 2),
+    "d": ("day", 2),
+    "H": ("hour", 2),
+    "M": ("minute", 2),
+    "S": ("second", 2),
+}
+
+_OFFSETS: list[tuple[str, list[Field]]] = [
+    ("+0000", [("sign", 0, 1), ("offset_hour", 1, 2), ("offset_minute", 3, 2)]),
+    ("+00:00", [("sign", 0, 1), ("offset_hour", 1, 2), ("offset_minute", 4, 2)]),
+]
+
+_STRPTIME_DEFAULTS = {"year": 1900, "month": 1, "day": 1}
+
+_RELAXED_DIGIT = re.compile(r"\[\d-\d\]|(?<![{,])\d(?![,}])")
+
+
+class _Template:
+    def __init__(self, time_format: str, layout: str, fields: list[Field]) -> None:
+        self.time_format = time_format
+        self.layout = layout
+        self.fields = fields
+
+        self.digits = [i for i, char in enumerate(layout) if char == "0"]
+        self.signs = [i for i, char in enumerate(layout) if char == "+"]
+        self.literals = [i for i, char in enumerate(layout) if char not in "0+"]
+        self.literal_codes = np.array([ord(layout[i]) for i in self.literals])
+
+
+def _layouts(time_format: str) -> list[tuple[str, list[Field]]] | None:
+    layouts: list[tuple[str, list[Field]]] = [("", [])]
+
+    position = 0
+    while position < len(time_format):
+        char = time_format[position]
+        pieces: list[tuple[str, list[Field]]]
+
+        if char == "%":
+            code = time_format[position + 1 : position + 2]
+            position += 2
+
+            if code in _FIELDS:
+                name, width = _FIELDS[code]
+                pieces = [("0" * width, [(name, 0, width)])]
+            elif code == "f":
+                following = time_format[position : position + 2]
+                if following[:1].isdigit() or following[1:] in _FIELDS:
+                    return None
+                pieces = [
+                    ("0" * width, [("fraction", 0, width)]) for width in range(1, 7)
+                ]
+            elif code == "z":
+                pieces = _OFFSETS
+            elif code == "%":
+                pieces = [("%", [])]
+            else:
+                return None
+        elif char.isspace():
+            while position < len(time_format) and time_format[position].isspace():
+                position += 1
+            pieces = [(" ", [])]
+        elif char.isdigit() or char == "+":
+            return None
+        else:
+            position += 1
+            pieces = [(char, [])]
+
+        layouts = [
+            (
+                layout + piece,
+                fields
+                + [
+                    (name, len(layout) + start, width)
+                    for name, start, width in piece_fields
+                ],
+            )
+            for layout, fields in layouts
+            for piece, piece_fields in pieces
+        ]
+
+    return layouts
+
+
+@functools.lru_cache()
+def _relaxed_regex(time_format: str) -> re.Pattern[str]:
+    return re.compile(_RELAXED_DIGIT.sub(r"\\d", _pattern(time_format)), re.IGNORECASE)
+
+
+def _shadowed(layout: str, earlier: tuple[str, ...]) -> bool:
+    samples = {layout.replace("+", sign) for sign in "+-"}
+
+    return any(
+        _relaxed_regex(time_format).fullmatch(sample)
+        for time_format in earlier
+        for sample in samples
+    )
+
+
+@functools.lru_cache()
+def _templates(formats: tuple[str, ...]) -> list[_Template]:
+    templates = []
+    for index, time_format in enumerate(formats):
+        for layout, fields in _layouts(time_format) or []:
+            if not _shadowed(layout, formats[:index]):
+                templates.append(_Template(time_format, layout, fields))
+
+    return templates
+
+
+def _number(codes: np.ndarray, start: int, width: int) -> np.ndarray:
+    number = np.zeros(len(codes), dtype=np.int64)
+    for position in range(start, start + width):
+        number = number * 10 + (codes[:, position] - 48)
+    return number
+
+
+def _valid_date(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    valid = (year >= 1) & (year <= 9999) & (month >= 1) & (month <= 12) & (day >= 1)
+
+    months = ((year - 1970) * 12 + month - 1).astype("datetime64[M]")
+    days = months.astype("datetime64[D]") + (day - 1).astype("timedelta64[D]")
+
+    return valid & (days.astype("datetime64[M]") == months)
+
+
+def _parse_template(
+    template: _Template,
+    codes: np.ndarray,
+    lengths: np.ndarray,
+    default_time: datetime | None,
+    result: np.ndarray,
+    valid: np.ndarray,
+) -> None:
+    defaults = Time.ALL ^ Time.TZINFO
+    if default_time:
+        defaults = format_defaults(template.time_format)
+        if defaults & Time.TZINFO and default_time.tzinfo is not None:
+            return
+
+    size = len(template.layout)
+    if size > codes.shape[1]:
+        return
+
+    rows = np.flatnonzero(~valid & (lengths == size))
+    if not rows.size:
+        return
+
+    row_codes = codes[rows, :size].astype(np.int64)
+    digits = row_codes[:, template.digits]
+    signs = row_codes[:, template.signs]
+
+    ok = ((digits >= 48) & (digits <= 57)).all(axis=1)
+    ok &= ((signs == 43) | (signs == 45)).all(axis=1)
+    ok &= (row_codes[:, template.literals] == template.literal_codes).all(axis=1)
+
+    rows, row_codes = rows[ok], row_codes[ok]
+    if not rows.size:
+        return
+
+    fields = {
+        name: _number(row_codes, start, width) for name, start, width in template.fields
+    }
+
+    if "short_year" in fields:
+        short_year = fields.pop("short_year")
+        fields["year"] = short_year + np.where(short_year >= 69, 1900, 2000)
+    if "fraction" in fields:
+        fraction_width = next(w for name, _, w in template.fields if name == "fraction")
+        fields["microsecond"] = fields.pop("fraction") * 10 ** (6 - fraction_width)
+
+    zeros = np.zeros(len(rows), dtype=np.int64)
+    year, month, day = (
+        fields.get(name, zeros + _STRPTIME_DEFAULTS[name])
+        for name in _STRPTIME_DEFAULTS
+    )
+    hour, minute, second, microsecond = (
+        fields.get(name, zeros) for name in ("hour", "minute", "second", "microsecond")
+    )
+
+    ok = _valid_date(year, month, day) & (hour <= 23) & (minute <= 59) & (second <= 59)
+
+    offset = zeros
+    if "sign" in fields:
+        ok &= (fields["offset_hour"] <= 23) & (fields["offset_minute"] <= 59)
+        offset = fields["offset_hour"] * 60 + fields["offset_minute"]
+        offset = np.where(fields["sign"] == ord("-") - ord("0"), -offset, offset)
+
+    if default_time:
+        if defaults & Time.YEAR:
+            year = zeros + default_time.year
+            ok &= _valid_date(year, month, day)
+        if defaults & Time.MONTH:
+            month = zeros + default_time.month
+            ok &= _valid_date(year, month, day)
+        if defaults & Time.DAY:
+            day = zeros + default_time.day
+            ok &= _valid_date(year, month, day)
+        if defaults & Time.HOUR:
+            hour = zeros + default_time.hour
+        if defaults & Time.MINUTE:
+            minute = zeros + default_time.minute
+        if defaults & Time.SECOND:
+            second = zeros + default_time.second
+        if defaults & Time.MICROSECOND:
+            microsecond = zeros + default_time.microsecond
+
+    rows = rows[ok]
+    year, month, day = year[ok], month[ok], day[ok]
+
+    days = (
+        ((year - 1970) * 12 + month - 1).astype("datetime64[M]").astype("datetime64[D]")
+    )
+    days += (day - 1).astype("timedelta64[D]")
+
+    minutes = hour[ok] * 60 + minute[ok] - offset[ok]
+    microseconds = (minutes * 60 + second[ok]) * 1_000_000 + microsecond[ok]
+
+    result[rows] = days.astype(_UNIT) + microseconds.astype("timedelta64[us]")
+    valid[rows] = True
+
+
+def _to_datetime64(time: datetime) -> np.datetime64:
+    offset = time.utcoffset()
+    if offset is not None:
+        time = time.replace(tzinfo=None) - offset
+
+    return np.datetime64(time, "us")
+
+
+def _parse_each(
+    strings: np.ndarray,
+    default_time: datetime | None,
+    formats: list[str] | None,
+    result: np.ndarray,
+    valid: np.ndarray,
+) -> None:
+    rows = np.flatnonzero(~valid)
+    if not rows.size:
+        return
+
+    uniques, inverse = np.unique(strings[rows], return_inverse=True)
+    parsed = np.full(len(uniques), np.datetime64("NaT"), dtype=_UNIT)
+    parsed_valid = np.zeros(len(uniques), dtype=bool)
+
+    for index, string in enumerate(uniques.tolist()):
+        try:
+            parsed[index] = _to_datetime64(parse_time(string, default_time, formats))
+        except (ValueError, OverflowError):
+            continue
+        parsed_valid[index] = True
+
+    result[rows] = parsed[inverse]
+    valid[rows] = parsed_valid[inverse]
+
+
+def parse(
+    strings: npt.ArrayLike,
+    default_time: datetime | None = None,
+    formats: list[str] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    strings = np.asarray(strings)
+    if strings.dtype.kind != "U":
+        strings = strings.astype(str)
+
+    shape = strings.shape
+    strings = np.ascontiguousarray(strings.ravel())
+
+    result = np.full(strings.size, np.datetime64("NaT"), dtype=_UNIT)
+    valid = np.zeros(strings.size, dtype=bool)
+
+    if strings.size:
+        codes = strings.view(np.uint32).reshape(strings.size, -1)
+        lengths = np.char.str_len(strings)
+
+        for template in _templates(tuple(formats or TIME_FORMATS)):
+            _parse_template(template, codes, lengths, default_time, result, valid)
+
+        _parse_each(strings, default_time, formats, result, valid)
+
+    return result.reshape(shape), valid.reshape(shape)
@@ -0,0 +1,196 @@
+import sys
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from operator import attrgetter
+from types import ModuleType
+from typing import Any, Callable, Iterator, Sequence
+
+from . import time_format
+from .time_format import TIME_FORMATS, Time, format_defaults
+
+_FIELDS = [
+    (Time.YEAR, "year"),
+    (Time.MONTH, "month"),
+    (Time.DAY, "day"),
+    (Time.HOUR, "hour"),
+    (Time.MINUTE, "minute"),
+    (Time.SECOND, "second"),
+    (Time.MICROSECOND, "microsecond"),
+]
+
+_RADIX = {
+    "year": 1,
+    "month": 13,
+    "day": 32,
+    "hour": 24,
+    "minute": 60,
+    "second": 60,
+    "microsecond": 1_000_000,
+}
+
+
+def _encode(fields: Callable[[str], Any], names: list[str]) -> Any:
+    key = 0
+    for name in names:
+        key = key * _RADIX[name] + fields(name)
+    return key
+
+
+class _Bound:
+    def __init__(self, time: str | datetime, time_formats: tuple[str, ...]) -> None:
+        if isinstance(time, datetime):
+            self.time = time
+            self.defaults = 0
+        else:
+            index, self.time = time_format._parse(time, time_formats)
+            self.defaults = format_defaults(time_formats[index])
+
+        positions = [
+            i for i, (field, _) in enumerate(_FIELDS) if not self.defaults & field
+        ]
+        self.names = [_FIELDS[i][1] for i in positions]
+        self.prefix = positions[0] if positions else len(_FIELDS)
+
+        self.key: Callable[[datetime], Any] | None = None
+        self.threshold: Any = self.time
+
+        if (
+            self.defaults & Time.TZINFO
+            and positions
+            and positions == list(range(positions[0], positions[-1] + 1))
+        ):
+            key = attrgetter(*self.names)
+            self.key = key
+            self.threshold = key(self.time)
+
+    @property
+    def sortable(self) -> bool:
+        return self.key is not None or not self.defaults
+
+    def anchor(self, time: datetime) -> datetime:
+        return time_format._apply_defaults(self.time, self.defaults, time)
+
+
+def _datetime64(times: Any) -> bool:
+    # An ndarray can only exist once numpy has been imported by the caller.
+    np: ModuleType | None = sys.modules.get("numpy")
+    if np is None:
+        return False
+
+    return isinstance(times, np.ndarray) and times.dtype.kind == "M"
+
+
+class Window:
+    def __init__(
+        self,
+        begin: str | datetime,
+        end: str | datetime,
+        time_formats: list[str] | None = None,
+    ) -> None:
+        formats = tuple(time_formats or TIME_FORMATS)
+
+        self._begin = _Bound(begin, formats)
+        self._end = _Bound(end, formats)
+
+    def anchor(self, time: datetime) -> tuple[datetime, datetime]:
+        return self._begin.anchor(time), self._end.anchor(time)
+
+    def contains(self, time: datetime) -> bool:
+        begin, end = self._begin, self._end
+
+        if begin.key is not None:
+            if begin.key(time) < begin.threshold:
+                return False
+        elif begin.anchor(time) > time:
+            return False
+
+        if end.key is not None:
+            return end.key(time) <= end.threshold
+
+        return time <= end.anchor(time)
+
+    def __contains__(self, time: datetime) -> bool:
+        return self.contains(time)
+
+    def _ranges(self, times: Sequence[datetime]) -> Iterator[tuple[int, int]]:
+        begin, end = self._begin, self._end
+
+        prefix = max(begin.prefix if begin.key else 0, end.prefix if end.key else 0)
+        period = attrgetter(*[name for _, name in _FIELDS[:prefix]]) if prefix else None
+
+        start, size = 0, len(times)
+        while start < size:
+            stop = size
+            if period is not None:
+                stop = bisect_right(
+                    times, period(times[start]), start, size, key=period
+                )
+
+            low = bisect_left(times, begin.threshold, start, stop, key=begin.key)
+            high = bisect_right(times, end.threshold, low, stop, key=end.key)
+            if low < high:
+                yield low, high
+
+            start = stop
+
+    def _numpy_mask(self, times: Any) -> Any:
+        import numpy as np
+
+        times = times.astype("datetime64[us]")
+
+        if not (self._begin.sortable and self._end.sortable):
+            return np.array(
+                [time is not None and self.contains(time) for time in times.tolist()],
+                dtype=bool,
+            )
+
+        years = times.astype("datetime64[Y]")
+        months = times.astype("datetime64[M]")
+        days = times.astype("datetime64[D]")
+        microseconds = (times - days).astype(np.int64)
+
+        fields = {
+            "year": years.astype(np.int64) + 1970,
+            "month": months.astype(np.int64) - years.astype(np.int64) * 12 + 1,
+            "day": (days - months.astype("datetime64[D]")).astype(np.int64) + 1,
+            "hour": microseconds // 3_600_000_000,
+            "minute": microseconds // 60_000_000 % 60,
+            "second": microseconds // 1_000_000 % 60,
+            "microsecond": microseconds % 1_000_000,
+        }
+
+        mask = ~np.isnat(times)
+        for bound, compare in (
+            (self._begin, np.greater_equal),
+            (self._end, np.less_equal),
+        ):
+            time = bound.time
+            names = bound.names
+            if bound.key is None:
+                if time.utcoffset() is not None:
+                    time = time.astimezone(timezone.utc).replace(tzinfo=None)
+                names = [name for _, name in _FIELDS]
+
+            threshold = _encode(lambda name: getattr(time, name), names)
+            mask &= compare(_encode(fields.__getitem__, names), threshold)
+
+        return mask
+
+    def mask(self, times: Sequence[datetime] | Any) -> list[bool] | Any:
+        if _datetime64(times):
+            return self._numpy_mask(times)
+
+        return [self.contains(time) for time in times]
+
+    def filter(
+        self, times: Sequence[datetime] | Any, is_sorted: bool = False
+    ) -> list[datetime] | Any:
+        if _datetime64(times):
+            return times[self._numpy_mask(times)]
+
+        if is_sorted and self._begin.sortable and self._end.sortable:
+            return [
+                time for low, high in self._ranges(times) for time in times[low:high]
+            ]
+
+        return [time for time in times if self.contains(time)]
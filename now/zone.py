@@ -0,0 +1,50 @@
+import functools
+from datetime import datetime, timezone, tzinfo
+
+from .now import Period, WeekStartDay
+from .periods import _STRIDES, period_key, period_start
+from .time_format import _MICROSECOND
+
+
+def resolve(wall: datetime, tz: tzinfo) -> datetime:
+    time = wall.replace(tzinfo=tz, fold=0)
+    resolved = time.astimezone(timezone.utc).astimezone(tz)
+    if resolved.replace(tzinfo=None) == wall:
+        return resolved
+
+    # The wall time falls in a gap, so the boundary is the first instant after it.
+    low, high = sorted(
+        int(wall.replace(tzinfo=tz, fold=fold).timestamp()) for fold in (0, 1)
+    )
+    while high - low > 1:
+        middle = (low + high) // 2
+        if datetime.fromtimestamp(middle, tz).replace(tzinfo=None) < wall:
+            low = middle
+        else:
+            high = middle
+
+    return datetime.fromtimestamp(high, tz)
+
+
+@functools.lru_cache(maxsize=4096)
+def _bounds(tz: tzinfo, period: Period, key: int) -> tuple[datetime, datetime]:
+    beginning = resolve(period_start(period, key), tz)
+    following = resolve(period_start(period, key + _STRIDES[period]), tz)
+
+    return beginning, (following.astimezone(timezone.utc) - _MICROSECOND).astimezone(tz)
+
+
+def bounds(
+    time: datetime,
+    period: Period | str,
+    week_start_day: WeekStartDay = WeekStartDay.SUNDAY,
+) -> tuple[datetime, datetime]:
+    period = Period(period)
+    if time.tzinfo is None:
+        raise ValueError("time must be timezone-aware")
+
+    return _bounds(time.tzinfo, period, period_key(period, week_start_day)(time))
+
+
+def cache_clear() -> None:
+    _bounds.cache_clear()
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from now.bucket import bucket
+from now.now import Now, Period, WeekStartDay
+
+BEGINNINGS = {
+    Period.MINUTE: Now.beginning_of_minute,
+    Period.HOUR: Now.beginning_of_hour,
+    Period.DAY: Now.beginning_of_day,
+    Period.WEEK: Now.beginning_of_week,
+    Period.MONTH: Now.beginning_of_month,
+    Period.QUARTER: Now.beginning_of_quarter,
+    Period.HALF: Now.beginning_of_half,
+    Period.YEAR: Now.beginning_of_year,
+}
+
+
+@pytest.fixture
+def times():
+    start = datetime(2021, 11, 28, 22, 58, 59, 999999)
+    return [start + timedelta(hours=i * 5, seconds=i * 13) for i in range(3000)]
+
+
+@pytest.mark.parametrize("period", list(Period))
+def test_bucket(times, period):
+    expected = {}
+    for time in times:
+        beginning = BEGINNINGS[period](Now(time, week_start_day=WeekStartDay.MONDAY))
+        expected[beginning] = expected.get(beginning, 0) + 1
+
+    result = bucket(times, period.value, WeekStartDay.MONDAY)
+
+    assert result == expected
+    assert list(result) == sorted(expected)
+
+
+def test_bucket_reducer():
+    tzinfo = timezone(timedelta(hours=2))
+    events = [
+        (datetime(2022, 10, 11, 10, 30, tzinfo=tzinfo), 3),
+        (datetime(2022, 11, 1, tzinfo=tzinfo), 4),
+        (datetime(2022, 12, 31, 23, 59, tzinfo=tzinfo), 5),
+        (datetime(2023, 1, 1, tzinfo=tzinfo), 6),
+    ]
+
+    result = bucket(
+        events,
+        Period.QUARTER,
+        reducer=lambda total, event: total + event[1],
+        key=lambda event: event[0],
+    )
+
+    assert result == {
+        datetime(2022, 10, 1, tzinfo=tzinfo): 12,
+        datetime(2023, 1, 1, tzinfo=tzinfo): 6,
+    }
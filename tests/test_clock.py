@@ -0,0 +1,65 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import now
+from now.clock import Clock, CoarseClock, FrozenClock
+
+
+@pytest.fixture
+def frozen():
+    clock = FrozenClock(datetime(2022, 10, 11, 10, 52, 25))
+    now.clock = clock
+    yield clock
+    now.clock = Clock()
+
+
+def test_frozen(frozen):
+    assert now.beginning_of_day() == datetime(2022, 10, 11)
+    assert now.end_of_hour() == datetime(2022, 10, 11, 10, 59, 59, 999999)
+    assert now.with_().time == frozen.time
+
+    frozen.time = datetime(2022, 10, 11, 23, 59, 59)
+    assert now.beginning_of_day() == datetime(2022, 10, 11)
+    assert now.beginning_of_hour() == datetime(2022, 10, 11, 23)
+
+    frozen.time = datetime(2022, 10, 12)
+    assert now.beginning_of_day() == datetime(2022, 10, 12)
+    assert now.end_of_week() == datetime(2022, 10, 15, 23, 59, 59, 999999)
+
+
+def test_frozen_settings(frozen):
+    assert now.beginning_of_week() == datetime(2022, 10, 9)
+
+    now.week_start_day = now.WeekStartDay.MONDAY
+    try:
+        assert now.beginning_of_week() == datetime(2022, 10, 10)
+    finally:
+        now.week_start_day = now.WeekStartDay.SUNDAY
+
+
+def test_frozen_time_zone():
+    clock = FrozenClock(datetime(2022, 10, 11, 23, 30, tzinfo=timezone.utc))
+
+    assert clock.now() is clock.time
+    assert clock.now(timezone(timedelta(hours=2))).day == 12
+
+
+def test_coarse():
+    calls = []
+
+    def source(tz):
+        calls.append(tz)
+        return datetime(2022, 10, 11, 10, len(calls))
+
+    clock = CoarseClock(timedelta(milliseconds=50), source)
+
+    assert clock.now() is clock.now()
+    assert len(calls) == 1
+
+    clock.now(timezone.utc)
+    assert calls == [None, timezone.utc]
+
+    time.sleep(0.06)
+    assert clock.now(timezone.utc).minute == 3
@@ -0,0 +1,100 @@
+import asyncio
+import contextvars
+import threading
+from datetime import datetime, timedelta, timezone
+
+import now
+from now import Config, WeekStartDay
+from now.clock import FrozenClock
+
+TIME = datetime(2022, 10, 11, 10, 52, 25, tzinfo=timezone.utc)
+
+
+def test_config():
+    config = Config(clock=FrozenClock(TIME))
+
+    assert config.week_start_day == WeekStartDay.SUNDAY
+    assert config.time_formats is now.TIME_FORMATS
+    assert config.now() is TIME
+    assert config.with_().beginning_of_week() == datetime(
+        2022, 10, 9, tzinfo=TIME.tzinfo
+    )
+
+    monday = config.replace(week_start_day=WeekStartDay.MONDAY)
+    assert monday.clock is config.clock
+    assert monday.with_().beginning_of_week() == datetime(
+        2022, 10, 10, tzinfo=TIME.tzinfo
+    )
+
+
+def test_using():
+    config = Config(
+        week_start_day=WeekStartDay.MONDAY,
+        time_zone=timezone(timedelta(hours=14)),
+        clock=FrozenClock(TIME),
+    )
+
+    with now.using(config) as scoped:
+        assert scoped is config
+        assert now.current_config() is config
+        assert now.beginning_of_week() == datetime(
+            2022, 10, 10, tzinfo=config.time_zone
+        )
+        assert now.beginning_of_day().day == 12
+
+        with now.using(week_start_day=WeekStartDay.SUNDAY):
+            assert now.beginning_of_week().day == 9
+            assert now.beginning_of_day().day == 12
+
+        assert now.beginning_of_week().day == 10
+
+    assert now.current_config() is not config
+    assert now.with_().time.tzinfo is None
+
+
+def test_using_global_settings():
+    now.week_start_day = WeekStartDay.MONDAY
+    try:
+        assert now.current_config().week_start_day == WeekStartDay.MONDAY
+        with now.using(clock=FrozenClock(TIME)):
+            assert now.beginning_of_week().day == 10
+    finally:
+        now.week_start_day = WeekStartDay.SUNDAY
+
+
+def test_using_tasks():
+    clock = FrozenClock(TIME)
+    tenants = {
+        week_start_day: Config(week_start_day=week_start_day, clock=clock)
+        for week_start_day in WeekStartDay
+    }
+
+    async def handle(week_start_day):
+        with now.using(tenants[week_start_day]):
+            await asyncio.sleep(0)
+            return now.beginning_of_week()
+
+    async def main():
+        return await asyncio.gather(*map(handle, WeekStartDay))
+
+    beginnings = asyncio.run(main())
+
+    assert [time.day for time in beginnings] == [9, 10]
+
+
+def test_using_threads():
+    config = Config(week_start_day=WeekStartDay.MONDAY, clock=FrozenClock(TIME))
+    results = []
+
+    def worker():
+        results.append(now.current_config() is config)
+
+    with now.using(config):
+        context = contextvars.copy_context()
+
+    for target in (worker, lambda: context.run(worker)):
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+
+    assert results == [False, True]
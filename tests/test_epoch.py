@@ -0,0 +1,90 @@
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from now import epoch
+from now.epoch import Unit, civil_from_days, days_from_civil
+from now.now import Now, WeekStartDay
+
+BOUNDARIES = [
+    "beginning_of_minute",
+    "beginning_of_hour",
+    "beginning_of_day",
+    "beginning_of_week",
+    "beginning_of_month",
+    "beginning_of_quarter",
+    "beginning_of_half",
+    "beginning_of_year",
+    "end_of_minute",
+    "end_of_hour",
+    "end_of_day",
+    "end_of_week",
+    "end_of_month",
+    "end_of_quarter",
+    "end_of_half",
+    "end_of_year",
+]
+
+ZONES = [
+    timezone.utc,
+    timezone(timedelta(hours=-3, minutes=-30)),
+    ZoneInfo("America/New_York"),
+    ZoneInfo("America/Santiago"),
+]
+
+
+def _call(name, timestamp, tz, unit, week_start_day):
+    if name.endswith("_week"):
+        return getattr(epoch, name)(timestamp, tz, unit, week_start_day)
+    return getattr(epoch, name)(timestamp, tz, unit)
+
+
+def test_civil_days():
+    for days in range(-700_000, 2_900_000, 997):
+        civil = civil_from_days(days)
+        assert civil == (date(1970, 1, 1) + timedelta(days)).timetuple()[:3]
+        assert days_from_civil(*civil) == days
+
+
+@pytest.mark.parametrize("tz", ZONES, ids=str)
+@pytest.mark.parametrize("week_start_day", list(WeekStartDay))
+def test_boundaries(tz, week_start_day):
+    start = int(datetime(2021, 3, 13, 0, 30, tzinfo=timezone.utc).timestamp())
+
+    for timestamp in range(start, start + 400 * 86400, 5 * 3600 + 7):
+        time = datetime.fromtimestamp(timestamp, tz)
+        now = Now(time, week_start_day=week_start_day)
+
+        for name in BOUNDARIES:
+            expected = getattr(now, name)()
+            assert (
+                _call(name, timestamp, tz, Unit.SECOND, week_start_day)
+                == expected.timestamp()
+            ), (name, time)
+            assert _call(
+                name, timestamp * 1_000_000, tz, Unit.MICROSECOND, week_start_day
+            ) == (expected - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(
+                microseconds=1
+            ), (
+                name,
+                time,
+            )
+
+
+@pytest.mark.parametrize("timestamp", [1639267199.9999996, -1.5, 1639267199.25])
+def test_float_seconds(timestamp):
+    now = Now(datetime.fromtimestamp(timestamp, timezone.utc))
+
+    assert epoch.end_of_minute(timestamp) == now.end_of_minute().timestamp()
+    assert epoch.beginning_of_day(timestamp) == now.beginning_of_day().timestamp()
+
+
+def test_ambiguous_hour():
+    tz = ZoneInfo("America/New_York")
+    first = int(datetime(2021, 11, 7, 5, 30, tzinfo=timezone.utc).timestamp())
+
+    for timestamp in (first, first + 3600):
+        now = Now(datetime.fromtimestamp(timestamp, tz))
+        assert epoch.end_of_hour(timestamp, tz) == now.end_of_hour().timestamp()
+        assert epoch.beginning_of_hour(timestamp, tz) == timestamp - 1800
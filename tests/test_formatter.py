@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from now.formatter import format, format_many
+from now.now import Now
+from now.time_format import TIME_FORMATS, parse
+
+TIMES = [
+    datetime(2006, 1, 2, 15, 4, 5, 999999, timezone(timedelta(hours=-7))),
+    datetime(1999, 12, 31, 0, 0, 0, 120000, timezone.utc),
+    datetime(2024, 2, 29, 12, 30, 59, 7, timezone(timedelta(hours=5, minutes=30))),
+    datetime(2022, 10, 11, 23, 59, tzinfo=timezone(timedelta(seconds=-3661))),
+]
+
+
+@pytest.mark.parametrize("time", TIMES)
+@pytest.mark.parametrize("time_format", TIME_FORMATS)
+def test_format_matches_strftime(time, time_format):
+    assert format(time, time_format) == time.strftime(time_format)
+
+
+# Feb 29 cannot be parsed back by formats without a year.
+@pytest.mark.parametrize("time", TIMES[:2] + TIMES[3:])
+@pytest.mark.parametrize("time_format", TIME_FORMATS)
+def test_format_round_trip(time, time_format):
+    string = format(time, time_format)
+
+    assert format(parse(string, formats=[time_format]), time_format) == string
+
+
+@pytest.mark.parametrize(
+    "time_format",
+    ["", "%%Y", "{%Y}", "%j %U", "'%H'\\n", "%Y%", "%Z%z", "%A %B %y"],
+)
+def test_format_literals_and_fallback(time_format):
+    time = TIMES[0]
+
+    assert format(time, time_format) == time.strftime(time_format)
+    assert format(time.replace(tzinfo=None), time_format) == time.replace(
+        tzinfo=None
+    ).strftime(time_format)
+
+
+def test_format_zero_pads_year():
+    assert format(datetime(1, 2, 3), "%Y-%m-%d") == "0001-02-03"
+
+
+def test_format_many():
+    assert list(format_many(TIMES, "%Y")) == ["2006", "1999", "2024", "2022"]
+    assert Now(TIMES[0]).format("%H:%M") == "15:04"
+
+
+def test_format_many_numpy():
+    np = pytest.importorskip("numpy")
+
+    times = np.array(["2006-01-02T15:04:05", "NaT"], dtype="datetime64[s]")
+
+    assert format_many(times, "%Y-%m-%d %H:%M:%S").tolist() == [
+        "2006-01-02 15:04:05",
+        "NaT",
+    ]
@@ -25,5 +25,12 @@ def test_main():
     now.monday("12:00")
     now.sunday("12:30")
     now.parse("12:30")
+    now.try_parse("N/A")
+    list(now.parse_many(["12:30", "13:00"]))
+    now.format(datetime.now(), "%Y-%m-%d")
+    list(now.format_many([datetime.now()], "%H:%M"))
     now.between("12:30", "13:00")
+    now.window("12:30", "13:00").contains(datetime.now())
     now.with_(datetime(2022, 10, 11, 10, 30, 0)).quarter()
+    now.bucket([datetime.now()], "week")
+    len(now.periods(datetime(2022, 1, 1), datetime.now(), "month"))
@@ -3,6 +3,7 @@ from datetime import datetime
 import pytest
 
 from now.now import Now, WeekStartDay
+from now.time_format import ParseCache
 
 
 @pytest.fixture
@@ -216,3 +217,61 @@ def test_week_range(now):
         else:
             time = datetime(year=2022, month=10, day=16, hour=23, minute=59, second=59, microsecond=999999)
         assert now.end_of_week() == time
+
+
+def test_adaptive(now):
+    assert not now.adaptive
+
+    now.adaptive = True
+
+    assert now.adaptive
+    assert now.parse("20:45") == now.time.replace(hour=20, minute=45)
+    assert now.parse("1-2") == now.time.replace(month=1, day=2)
+
+
+def test_parse_many(now):
+    assert list(now.parse_many(["20:45", "10-9"])) == [
+        now.time.replace(hour=20, minute=45),
+        now.time.replace(month=10, day=9),
+    ]
+
+
+def test_parse_cache(now):
+    assert now.parse_cache is None
+
+    now.parse_cache = ParseCache()
+
+    assert now.between("9:30", "12:15")
+    assert now.between("9:30", "12:15")
+    assert now.parse_cache.cache_info().hits == 2
+
+
+def test_boundaries_memoized(now):
+    end_of_year = now.end_of_year()
+    beginning_of_week = now.beginning_of_week()
+
+    assert now.end_of_year() is end_of_year
+    assert now.beginning_of_week() is beginning_of_week
+
+    now.week_start_day = WeekStartDay.MONDAY
+    assert now.end_of_year() == end_of_year
+    assert now.beginning_of_week() == datetime(2022, 10, 10)
+
+    now.time = datetime(2023, 2, 1)
+    assert now.end_of_year() == datetime(2023, 12, 31, 23, 59, 59, 999999)
+    assert now.beginning_of_week() == datetime(2023, 1, 30)
+    assert now.end_of_quarter() == datetime(2023, 3, 31, 23, 59, 59, 999999)
+
+
+def test_boundaries_at_range_limits():
+    first = Now(datetime.min, week_start_day=WeekStartDay.MONDAY)
+    last = Now(datetime.max)
+
+    assert first.beginning_of_day() == datetime.min
+    assert first.beginning_of_week() == datetime.min
+    assert first.beginning_of_quarter() == datetime.min
+    assert first.beginning_of_half() == datetime.min
+    assert last.end_of_day() == datetime.max
+    assert last.end_of_quarter() == datetime.max
+    assert last.end_of_half() == datetime.max
+    assert last.beginning_of_week() == datetime(9999, 12, 26)
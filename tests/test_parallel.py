@@ -0,0 +1,81 @@
+import array
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from now.__main__ import main
+from now.parallel import convert_file, epoch_microseconds, parse_file
+from now.time_format import parse
+
+LINES = [
+    "2006-01-02 15:04:05",
+    "2006-01-02T15:04:05Z-0700",
+    "Jan 2 15:04:05.123",
+    "20060102",
+    "1/2/2006",
+] * 40
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "times.txt"
+    path.write_text("\r\n".join(LINES) + "\n")
+    return str(path)
+
+
+def test_epoch_microseconds():
+    assert epoch_microseconds(datetime(1970, 1, 1, 0, 0, 1, 5)) == 1_000_005
+    assert epoch_microseconds(datetime(1969, 12, 31, 23, 59, 59)) == -1_000_000
+    assert (
+        epoch_microseconds(datetime(1970, 1, 1, 2, tzinfo=timezone(timedelta(hours=2))))
+        == 0
+    )
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 1 << 20), (2, 100), (3, 1)])
+def test_parse_file(path, workers, chunk_size):
+    default_time = datetime(2022, 10, 11, 10, 30, 15)
+
+    result = parse_file(path, default_time, workers=workers, chunk_size=chunk_size)
+
+    assert result == array.array(
+        "q", [epoch_microseconds(parse(line, default_time)) for line in LINES]
+    )
+
+
+def test_parse_file_invalid(tmp_path):
+    path = tmp_path / "times.txt"
+    path.write_text("2006\nN/A\n2007")
+
+    with pytest.raises(ValueError):
+        parse_file(str(path))
+
+    assert parse_file(str(path), invalid=-1, formats=["%Y"]).tolist() == [
+        epoch_microseconds(datetime(2006, 1, 1)),
+        -1,
+        epoch_microseconds(datetime(2007, 1, 1)),
+    ]
+
+
+def test_parse_file_empty(tmp_path):
+    path = tmp_path / "times.txt"
+    path.write_text("")
+
+    assert parse_file(str(path)).tolist() == []
+
+
+def test_convert_file(path, tmp_path):
+    output = str(tmp_path / "times.bin")
+
+    assert convert_file(path, output, workers=2, chunk_size=256) == len(LINES)
+
+    result = array.array("q")
+    with open(output, "rb") as file:
+        result.fromfile(file, len(LINES))
+    assert result == parse_file(path)
+
+
+def test_main(path, capsys):
+    main([path, "--workers", "1"])
+
+    assert capsys.readouterr().out.split() == [str(v) for v in parse_file(path)]
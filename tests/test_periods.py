@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from now.now import Now, Period, WeekStartDay
+from now.periods import Periods, period_end, period_key, period_start
+
+BOUNDARIES = {
+    Period.MINUTE: (Now.beginning_of_minute, Now.end_of_minute),
+    Period.HOUR: (Now.beginning_of_hour, Now.end_of_hour),
+    Period.DAY: (Now.beginning_of_day, Now.end_of_day),
+    Period.WEEK: (Now.beginning_of_week, Now.end_of_week),
+    Period.MONTH: (Now.beginning_of_month, Now.end_of_month),
+    Period.QUARTER: (Now.beginning_of_quarter, Now.end_of_quarter),
+    Period.HALF: (Now.beginning_of_half, Now.end_of_half),
+    Period.YEAR: (Now.beginning_of_year, Now.end_of_year),
+}
+
+
+SPANS = {
+    Period.MINUTE: timedelta(minutes=150),
+    Period.HOUR: timedelta(hours=50),
+    Period.DAY: timedelta(days=50),
+    Period.WEEK: timedelta(days=120),
+    Period.MONTH: timedelta(days=800),
+    Period.QUARTER: timedelta(days=800),
+    Period.HALF: timedelta(days=1500),
+    Period.YEAR: timedelta(days=3000),
+}
+
+
+@pytest.fixture
+def times():
+    start = datetime(2021, 11, 28, 22, 58, 59, 999999)
+    return [start + timedelta(hours=i * 5, seconds=i * 13) for i in range(3000)]
+
+
+@pytest.mark.parametrize("period", list(Period))
+@pytest.mark.parametrize("week_start_day", list(WeekStartDay))
+def test_period_key(times, period, week_start_day):
+    key = period_key(period, week_start_day)
+    beginning, end = BOUNDARIES[period]
+
+    for time in times:
+        now = Now(time, week_start_day=week_start_day)
+        assert period_start(period, key(time)) == beginning(now)
+        assert period_end(period, key(time)) == end(now)
+
+
+@pytest.mark.parametrize("period", list(Period))
+def test_periods(period):
+    start = datetime(2021, 12, 30, 23, 58, 30, tzinfo=timezone.utc)
+    end = start + SPANS[period]
+    beginning_of, end_of = BOUNDARIES[period]
+
+    expected = []
+    now = Now(start)
+    while now.time <= end_of(Now(end)):
+        expected.append((beginning_of(now), end_of(now)))
+        now = Now(end_of(now) + timedelta(microseconds=1))
+
+    periods = Periods(start, end, period)
+
+    assert list(periods) == expected
+    assert len(periods) == len(expected)
+    assert [periods[i] for i in range(len(periods))] == expected
+    assert periods[-1] == expected[-1]
+    assert list(reversed(periods)) == expected[::-1]
+
+
+def test_periods_membership():
+    periods = Periods(datetime(1900, 1, 15), datetime(2099, 12, 1), "month")
+
+    assert len(periods) == 200 * 12
+    assert datetime(2022, 10, 11) in periods
+    assert datetime(2100, 1, 1) not in periods
+    assert "2022-10-11" not in periods
+    assert periods.index(datetime(2022, 10, 11)) == 122 * 12 + 9
+    assert periods[122 * 12 + 9] == (
+        datetime(2022, 10, 1),
+        datetime(2022, 10, 31, 23, 59, 59, 999999),
+    )
+
+
+def test_periods_edges():
+    assert len(Periods(datetime(2022, 10, 11), datetime(2022, 10, 1), "week")) == 0
+    assert Periods(datetime(9999, 12, 1), datetime(9999, 12, 31), "year")[0] == (
+        datetime(9999, 1, 1),
+        datetime(9999, 12, 31, 23, 59, 59, 999999),
+    )
+    assert list(
+        Periods(
+            datetime(2022, 10, 11), datetime(2022, 10, 16), "week", WeekStartDay.MONDAY
+        )
+    ) == [
+        (datetime(2022, 10, 10), datetime(2022, 10, 16, 23, 59, 59, 999999)),
+    ]
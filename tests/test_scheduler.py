@@ -0,0 +1,153 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from now import Config, Period, WeekStartDay
+from now.clock import Clock, FrozenClock
+from now.scheduler import Scheduler
+
+
+def loop_clock(start):
+    loop = asyncio.get_running_loop()
+    origin = loop.time()
+
+    def source(tz):
+        time = start + timedelta(seconds=loop.time() - origin)
+        return time if tz is None else time.astimezone(tz)
+
+    return Clock(source)
+
+
+def test_dispatches_due_subscribers_together():
+    async def main():
+        clock = loop_clock(datetime(2022, 10, 15, 23, 59, 59, 950000))
+        scheduler = Scheduler(Config(clock=clock))
+        fired = []
+
+        for period in ("minute", Period.DAY, Period.WEEK, Period.MONTH):
+            scheduler.subscribe(
+                period, lambda time, period=period: fired.append((period, time))
+            )
+
+        await asyncio.sleep(0.2)
+        scheduler.close()
+
+        return fired, scheduler
+
+    fired, scheduler = asyncio.run(main())
+
+    assert fired == [
+        ("minute", datetime(2022, 10, 16)),
+        (Period.DAY, datetime(2022, 10, 16)),
+        (Period.WEEK, datetime(2022, 10, 16)),
+    ]
+    assert len(scheduler) == 0
+
+
+def test_week_start_day_and_time_zone():
+    tz = timezone(timedelta(hours=2))
+
+    async def main():
+        clock = loop_clock(datetime(2022, 10, 16, 21, 59, 59, 950000, timezone.utc))
+        config = Config(week_start_day=WeekStartDay.MONDAY, time_zone=tz, clock=clock)
+        scheduler = Scheduler(config)
+        other = scheduler.subscribe(Period.DAY, lambda time: None)
+
+        monday = await scheduler.wait(Period.WEEK)
+        other.cancel()
+
+        return monday, scheduler
+
+    monday, scheduler = asyncio.run(main())
+
+    assert monday == datetime(2022, 10, 17, tzinfo=tz)
+    assert len(scheduler) == 0
+
+
+def test_reschedules_and_cancels():
+    async def main():
+        clock = loop_clock(datetime(2022, 10, 11, 10, 52, 59, 950000))
+        scheduler = Scheduler(Config(clock=clock))
+        fired = []
+
+        async def record(time):
+            fired.append(time)
+
+        subscription = scheduler.subscribe(Period.MINUTE, record)
+        other = scheduler.subscribe(Period.MINUTE, fired.append)
+        other.cancel()
+
+        await asyncio.sleep(0.1)
+        assert scheduler._heap[0][2] == datetime(2022, 10, 11, 10, 54)
+
+        subscription.cancel()
+        assert scheduler._timer is None
+
+        return fired
+
+    assert asyncio.run(main()) == [datetime(2022, 10, 11, 10, 53)]
+
+
+def test_callback_errors_are_isolated():
+    errors = []
+
+    async def main():
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: errors.append(context["exception"])
+        )
+        clock = loop_clock(datetime(2022, 10, 11, 10, 59, 59, 950000))
+        scheduler = Scheduler(Config(clock=clock))
+        fired = []
+
+        scheduler.subscribe(Period.HOUR, lambda time: 1 / 0)
+        scheduler.subscribe(Period.HOUR, fired.append)
+
+        await asyncio.sleep(0.1)
+        scheduler.close()
+
+        return fired
+
+    assert asyncio.run(main()) == [datetime(2022, 10, 11, 11)]
+    assert [type(error) for error in errors] == [ZeroDivisionError]
+
+
+def test_cancel_head_subscription():
+    async def main():
+        clock = loop_clock(datetime(2022, 10, 11, 10, 52, 59, 950000))
+        scheduler = Scheduler(Config(clock=clock))
+        fired = []
+
+        minute = scheduler.subscribe(Period.MINUTE, fired.append)
+        scheduler.subscribe(Period.DAY, fired.append)
+        minute.cancel()
+
+        assert scheduler._timer_due == datetime(2022, 10, 12).timestamp()
+
+        await asyncio.sleep(0.1)
+        scheduler.close()
+
+        return fired
+
+    assert asyncio.run(main()) == []
+
+
+def test_frozen_clock():
+    async def main():
+        clock = FrozenClock(datetime(2022, 10, 11, 10, 52, 59, 950000))
+        scheduler = Scheduler(Config(clock=clock))
+        fired = []
+        fires = 0
+
+        def count():
+            nonlocal fires
+            fires += 1
+            fire()
+
+        fire, scheduler._fire = scheduler._fire, count
+        scheduler.subscribe(Period.MINUTE, fired.append)
+
+        await asyncio.sleep(0.2)
+        scheduler.close()
+
+        return fired, fires
+
+    assert asyncio.run(main()) == ([datetime(2022, 10, 11, 10, 53)], 1)
@@ -3,7 +3,16 @@ from zoneinfo import ZoneInfo
 
 import pytest
 
-from now.time_format import parse
+from now import time_format
+from now.time_format import (
+    TIME_FORMATS,
+    Eviction,
+    ParseCache,
+    parse,
+    parse_many,
+    parse_many_epoch,
+    try_parse,
+)
 
 
 def current_datetime(*args, **kwargs):
@@ -156,3 +165,369 @@ def test_parse_current_time(time, expected):
 def test_parse_invalid_time():
     with pytest.raises(ValueError):
         parse("11:00:00 AM")
+
+
+def strptime_loop(string, formats=TIME_FORMATS):
+    for time_format in formats:
+        try:
+            return datetime.strptime(string, time_format)
+        except ValueError:
+            pass
+    return None
+
+
+@pytest.mark.parametrize(
+    "time",
+    [
+        "",
+        "12",
+        "123",
+        "200611",
+        "2006112",
+        "200612311",
+        "2006-02-30",
+        "2006-13",
+        "2006-1-2  15",
+        "13:60",
+        "24:00",
+        "1/2/06",
+        "12:30pm",
+        "12:30PM",
+        "MON JAN 2 15:04:05 2006",
+        "Mon Jan 02 15:04:05 Z 2006",
+        "2006-01-02T15:04:05Z+07:00",
+        "Feb 30 15:04:05",
+        "Jan 2 15:04:05.1234567",
+        "11:00:00 AM",
+    ],
+)
+def test_parse_matches_strptime_loop(time):
+    expected = strptime_loop(time)
+
+    if expected is None:
+        with pytest.raises(ValueError):
+            parse(time)
+    else:
+        assert parse(time) == expected
+
+
+def test_parse_first_match_wins():
+    formats = ["%m%d", "%Y", "%H%M"]
+
+    assert parse("1230", formats=formats) == datetime(year=1900, month=12, day=30)
+    assert parse("1231", formats=formats[1:]) == datetime(year=1231, month=1, day=1)
+    assert parse("0230", formats=formats) == datetime(year=230, month=1, day=1)
+
+
+def fast_path_inputs():
+    times = [
+        datetime(2006, 1, 2, 15, 4, 5, 999999),
+        datetime(1999, 12, 31, 23, 59, 59, 120000),
+        datetime(2024, 2, 29, 0, 0, 0, 7),
+        datetime(1, 10, 9, 9, 9, 9, 100),
+    ]
+    for time in times:
+        yield time.strftime("%Y-%m-%d %H:%M:%S")
+        yield time.strftime("%Y-%m-%d\t%H:%M:%S")
+        yield time.strftime("%Y-%m-%d  %H:%M:%S")
+        yield f"{time:%Y}-{time.month}-{time.day}  {time:%H:%M:%S}"
+        yield time.strftime("%Y-%m-%dT%H:%M:%SZ%z")
+        yield time.strftime("%Y-%m-%dT%H:%M:%SZZ")
+        yield time.strftime("%Y-%m-%dt%H:%M:%Sz-0700")
+        yield time.strftime("%Y-%m-%dT%H:%M:%SZ+05:30")
+        yield time.strftime("%Y-%m-%dT%H:%M:%SZ+0530")
+        yield time.strftime("%Y-%m-%dT%H:%M:%SZ-01:02:03")
+        yield time.strftime("%Y-%m-%dT%H:%M:%SZ+9999")
+        yield time.strftime("%Y%m%d")
+        yield f"{time:%Y}{time.month}{time.day}"
+        yield time.strftime("%Y/%m/%d")
+        yield f"{time:%Y}/{time.month}/ {time.day}"
+        yield time.strftime("%Y.%m.%d %H:%M:%S.%f")
+        yield time.strftime("%Y.%m.%d %H:%M:%S.%f")[:-3]
+        yield time.strftime("%Y.%m.%d %H:%M:%S.") + "1"
+        yield f"{time:%Y.%m}.{time.day} {time:%H:%M:%S.%f}"
+    yield "2006-02-30 15:04:05"
+    yield "2006-02-29T15:04:05Z-0700"
+    yield "20060230"
+    yield "20061301"
+    yield "2006/02/30"
+    yield "2006.02.30 15:04:05.1"
+    yield "2006-01-02 24:04:05"
+    yield "2006-01-02 15:04:61"
+
+
+@pytest.mark.parametrize("time", list(fast_path_inputs()))
+def test_parse_fast_path_matches_strptime_loop(time):
+    expected = strptime_loop(time)
+
+    if expected is None:
+        with pytest.raises(ValueError):
+            parse(time)
+    else:
+        result = parse(time)
+        assert result == expected
+        assert result.utcoffset() == expected.utcoffset()
+
+
+def test_parse_adaptive():
+    times = ["Jan 2 15:04:05", "Jan 2 15:04:05.123", "Jan 3 15:04:05", "3:04PM"]
+    times += ["2006", "2006-01-02 15:04:05", "20060102", "1230", "2006-01-02"]
+
+    for time in times * 2:
+        assert parse(time, adaptive=True) == parse(time)
+
+
+def test_parse_adaptive_respects_precedence():
+    formats = ["%H%M", "%Y"]
+
+    assert parse("1999", formats=formats, adaptive=True) == datetime(1999, 1, 1)
+    assert parse("1230", formats=formats, adaptive=True) == datetime(1900, 1, 1, 12, 30)
+    assert parse("2099", formats=formats, adaptive=True) == datetime(2099, 1, 1)
+
+
+def test_parse_many():
+    times = ["2006-01-02 15:04:05", "2006-01-03 15:04:05", "2006-01-03", "1230"]
+    times += ["Jan 2 15:04:05", "Jan 2 15:04:05.5", "2099", "12"]
+    default_time = datetime(2022, 10, 11, 10, 30, 15)
+
+    assert list(parse_many(times)) == [parse(time) for time in times]
+    assert list(parse_many(times, default_time)) == [
+        parse(time, default_time) for time in times
+    ]
+
+
+def test_parse_many_respects_precedence():
+    formats = ["%H%M", "%Y"]
+
+    assert list(parse_many(["2099", "1230", "2099"], formats=formats)) == [
+        datetime(2099, 1, 1),
+        datetime(1900, 1, 1, 12, 30),
+        datetime(2099, 1, 1),
+    ]
+
+
+def test_parse_back_fill_failure():
+    with pytest.raises(ValueError, match="Can't parse string as time: '2006-02'"):
+        parse("2006-02", datetime(2022, 4, 30))
+
+    times = parse_many(["12:30", "1997"], datetime(2024, 2, 29))
+    assert next(times) == datetime(2024, 2, 29, 12, 30)
+    with pytest.raises(ValueError, match="Can't parse string as time: '1997'"):
+        next(times)
+
+
+def test_parse_many_invalid_time():
+    times = parse_many(iter(["2006-01-02", "N/A", "2006-01-03"]))
+
+    assert next(times) == datetime(2006, 1, 2)
+    with pytest.raises(ValueError):
+        next(times)
+
+
+def test_parse_cache():
+    cache = ParseCache(maxsize=2)
+    default_time = datetime(2022, 10, 11, 10, 30, 15)
+
+    assert cache.parse("12:30", default_time) == parse("12:30", default_time)
+    assert cache.parse("12:30", default_time) == parse("12:30", default_time)
+    assert cache.parse("12:30") == parse("12:30")
+    assert cache.cache_info() == (2, 1, 2, 1)
+
+    with pytest.raises(ValueError):
+        cache.parse("N/A")
+
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 2, 0)
+
+
+def test_parse_cache_moving_default_time():
+    cache = ParseCache()
+    default_time = datetime(2022, 10, 11, 10, 30, 15)
+
+    for days in range(3):
+        time = default_time + timedelta(days=days, microseconds=days)
+
+        assert cache.parse("12:30", time) == parse("12:30", time)
+        assert cache.parse("2006-01-02 15:04:05", time) == parse(
+            "2006-01-02 15:04:05", time
+        )
+
+    assert cache.cache_info().misses == 2
+
+
+def test_parse_cache_formats():
+    cache = ParseCache()
+
+    assert cache.parse("1230") == datetime(1230, 1, 1)
+    assert cache.parse("1230", formats=["%H%M"]) == datetime(1900, 1, 1, 12, 30)
+    assert cache.cache_info().misses == 2
+
+
+@pytest.mark.parametrize(
+    "eviction, cached", [(Eviction.LRU, ["1", "3"]), (Eviction.FIFO, ["2", "3"])]
+)
+def test_parse_cache_eviction(eviction, cached):
+    cache = ParseCache(maxsize=2, eviction=eviction)
+
+    for time in ["1", "2", "1", "3"]:
+        cache.parse(time)
+
+    misses = cache.cache_info().misses
+    for time in cached:
+        cache.parse(time)
+    assert cache.cache_info().misses == misses
+
+
+@pytest.fixture
+def events():
+    events = []
+    time_format.enable_stats(events.append)
+    yield events
+    time_format.disable_stats()
+
+
+def test_stats(events):
+    parse("2006-01-02")
+    parse("2006-01-03")
+    with pytest.raises(ValueError):
+        parse("2006-02-30")
+    with pytest.raises(ValueError):
+        parse("not a time")
+
+    stats = time_format.stats()
+    assert stats.rejections == 2
+    assert stats.formats["%Y-%m-%d"][:3] == (3, 2, 1)
+    assert stats.formats["%Y-%m-%d"].seconds > 0
+    assert [event.time_format for event in events] == [
+        "%Y-%m-%d",
+        "%Y-%m-%d",
+        "%Y-%m-%d",
+        None,
+        None,
+    ]
+
+    time_format.reset_stats()
+    assert time_format.stats() == time_format.ParseStats({}, 0)
+
+
+def test_stats_back_fill_failure(events):
+    with pytest.raises(ValueError):
+        parse("2023-02", datetime(2024, 1, 31))
+
+    stats = time_format.stats()
+    assert stats.formats["%Y-%m"][:3] == (1, 0, 1)
+    assert stats.rejections == 1
+
+
+def test_stats_disabled():
+    parse("2006-01-02")
+
+    assert time_format.stats() == time_format.ParseStats({}, 0)
+
+
+def try_parse_inputs():
+    time = datetime(2006, 1, 2, 15, 4, 5, 999999, timezone(timedelta(hours=-7)))
+    for time_format in TIME_FORMATS:
+        yield time.strftime(time_format)
+        yield time.strftime(time_format).upper()
+        yield time.strftime(time_format).replace(" ", "  ")
+    yield from fast_path_inputs()
+    yield from ["", " ", "N/A", "null", "-", "123e4567-e89b-12d3-a456-426614174000"]
+    yield from ["Monday", "Mon Jan 02 15:04:05 Z 2006", " 2 Jan 06 15:04 Z"]
+
+
+@pytest.mark.parametrize("time", list(try_parse_inputs()))
+def test_try_parse_matches_strptime_loop(time):
+    assert try_parse(time) == strptime_loop(time)
+
+
+def test_try_parse_default():
+    default = datetime(2000, 1, 1)
+
+    assert try_parse("N/A", default=default) is default
+    assert try_parse("2006-02-30", default=default) is default
+    assert try_parse("12:30", datetime(2022, 10, 11)) == datetime(2022, 10, 11, 12, 30)
+
+
+@pytest.mark.parametrize(
+    "time, default_time",
+    [
+        ("2006-02", datetime(2022, 4, 30)),
+        ("2022-09", datetime(2022, 10, 31)),
+        ("1997", datetime(2024, 2, 29)),
+    ],
+)
+def test_try_parse_back_fill_failure(time, default_time):
+    assert try_parse(time, default_time) is None
+    assert try_parse(time, default_time, default=default_time) is default_time
+    assert try_parse("02-28", default_time) == default_time.replace(month=2, day=28)
+
+
+def compiled_inputs():
+    time = datetime(2006, 1, 2, 15, 4, 5, 120000, timezone(timedelta(hours=5.5)))
+    formats = TIME_FORMATS + ["%d %B %Y", "%y", "%I %p", "%H %p", "%z %Z", "%A %d"]
+    for format_string in formats:
+        string = time.strftime(format_string)
+        for variant in (string, string.upper(), string.lower(), string[:-1]):
+            yield format_string, variant
+
+    yield from [
+        ("%b %d", "Feb 29"),
+        ("%b %d", "Feb 28"),
+        ("%I:%M%p", "12:00AM"),
+        ("%I:%M%p", "12:00pm"),
+        ("%I:%M%p", "13:00PM"),
+        ("%y", "68"),
+        ("%y", "69"),
+        ("%Y-%m-%dT%H:%M:%SZ%z", "2006-01-02T15:04:05Z+01:02:03.5"),
+        ("%Y-%m-%dT%H:%M:%SZ%z", "2006-01-02T15:04:05Z+0102:03"),
+        ("%Y-%m-%dT%H:%M:%SZ%z", "2006-01-02T15:04:05Z+99:00"),
+        ("%z %Z", "-01:30 gmt"),
+        ("%j", "032"),
+    ]
+
+
+@pytest.mark.parametrize("format_string, string", list(compiled_inputs()))
+def test_compiled_parser_matches_strptime(format_string, string):
+    try:
+        expected = datetime.strptime(string, format_string)
+    except ValueError:
+        with pytest.raises(ValueError):
+            time_format._compile(format_string)(string)
+    else:
+        result = time_format._compile(format_string)(string)
+        assert repr(result) == repr(expected)
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ("2006-01-02T15:04:05Z+01:00", "2007-03-04T05:06:07Z+0100"),
+        ("Mon Jan 02 15:04:05 -0700 2006", "Tue, 03 Jan 2006 15:04:05 -0700"),
+    ],
+)
+def test_parse_interns_offsets(a, b):
+    assert parse(a).tzinfo is parse(b).tzinfo
+
+
+def test_parse_many_utc():
+    times = [
+        "2006-01-02T15:04:05Z+01:00",
+        "2006-01-02T15:04:05Z-0530",
+        "2006-01-02 15:04:05",
+        "15:04",
+        "23:30 +0130",
+    ]
+    formats = TIME_FORMATS + ["%H:%M %z"]
+    default_time = datetime(2022, 10, 11, 10, 30, 15, 5, timezone(timedelta(hours=2)))
+    expected = [parse(time, default_time, formats) for time in times]
+
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    assert list(parse_many(times, default_time, formats, utc=True)) == [
+        time.astimezone(timezone.utc).replace(tzinfo=None) for time in expected
+    ]
+    assert list(parse_many_epoch(times, default_time, formats)) == [
+        (time - epoch) // timedelta(microseconds=1) for time in expected
+    ]
+    assert list(parse_many_epoch(["2006-01-02"])) == [1136160000000000]
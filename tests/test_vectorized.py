@@ -0,0 +1,149 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from now.now import Now, WeekStartDay
+from now.time_format import parse
+
+np = pytest.importorskip("numpy")
+vectorized = pytest.importorskip("now.vectorized")
+
+METHODS = [
+    "beginning_of_minute",
+    "beginning_of_hour",
+    "beginning_of_day",
+    "beginning_of_week",
+    "beginning_of_month",
+    "beginning_of_quarter",
+    "beginning_of_half",
+    "beginning_of_year",
+    "end_of_minute",
+    "end_of_hour",
+    "end_of_day",
+    "end_of_week",
+    "end_of_month",
+    "end_of_quarter",
+    "end_of_half",
+    "end_of_year",
+]
+
+
+@pytest.fixture
+def times():
+    start = datetime(1960, 2, 27, 22, 59, 59, 999999)
+    return [start + timedelta(days=i * 37, seconds=i * 3671) for i in range(800)]
+
+
+@pytest.mark.parametrize("method", METHODS)
+@pytest.mark.parametrize("week_start_day", list(WeekStartDay))
+def test_matches_now(times, method, week_start_day):
+    if "week" in method:
+        result = getattr(vectorized, method)(np.array(times), week_start_day)
+    else:
+        result = getattr(vectorized, method)(np.array(times))
+
+    expected = [
+        getattr(Now(time, week_start_day=week_start_day), method)() for time in times
+    ]
+
+    assert result.dtype == np.dtype("datetime64[us]")
+    assert result.tolist() == expected
+
+
+def test_nat():
+    times = np.array(["2022-10-11T10:30:15", "NaT"], dtype="datetime64[s]")
+
+    result = vectorized.end_of_quarter(times)
+
+    assert result[0] == np.datetime64("2022-12-31T23:59:59.999999")
+    assert np.isnat(result[1])
+
+
+PARSE_INPUTS = [
+    "2006",
+    "2006-1",
+    "2006-01-02",
+    "2006-01-02 15",
+    "2006-01-02 15:04",
+    "2006-01-02 15:04:05",
+    "2006-1-2 15:4:5",
+    "01-02",
+    "02-29",
+    "1-31",
+    "15:04:05",
+    "15:04",
+    "15",
+    "2006-01-02T15:04:05Z-0700",
+    "2006-01-02T15:04:05Z+05:30",
+    "2006-01-02T15:04:05ZZ",
+    "2006.01.02",
+    "2006.01.02 15:04:05",
+    "2006.01.02 15:04:05.1",
+    "2006.01.02 15:04:05.999999",
+    "01/02/2006",
+    "01/02/2006 15:04:05",
+    "2006/01/02",
+    "20060102",
+    "20061301",
+    "2006/01/02 15:04:05",
+    "Mon Jan 2 15:04:05 2006",
+    "Mon Jan 02 15:04:05 -0700 2006",
+    "02 Jan 06 15:04 -0700",
+    "Mon, 02 Jan 2006 15:04:05 -0700",
+    "3:04PM",
+    "Jan 2 15:04:05.000",
+    "2006-02-30",
+    "0000-01-01",
+    "2006-01-02 24:00:00",
+    "",
+    "N/A",
+]
+
+
+def scalar_parse(string, default_time=None, formats=None):
+    try:
+        time = parse(string, default_time, formats)
+    except ValueError:
+        return None
+    if time.utcoffset() is not None:
+        time = time.replace(tzinfo=None) - time.utcoffset()
+    return time
+
+
+@pytest.mark.parametrize(
+    "default_time",
+    [
+        None,
+        datetime(2022, 10, 11, 10, 30, 15, 123),
+        datetime(2024, 2, 29, 10, 30, 15),
+        datetime(2022, 10, 11, 10, 30, 15, tzinfo=timezone(timedelta(hours=2))),
+    ],
+)
+def test_parse_matches_scalar(default_time):
+    result, valid = vectorized.parse(PARSE_INPUTS, default_time)
+
+    for string, time, ok in zip(PARSE_INPUTS, result.tolist(), valid):
+        expected = scalar_parse(string, default_time)
+
+        assert ok == (expected is not None), string
+        assert time == expected, string
+
+
+def test_parse_formats():
+    formats = ["%H%M", "%Y", "%d.%m.%Y"]
+    strings = np.array(["1230", "2099", "31.12.2006", "2006"])
+
+    result, valid = vectorized.parse(strings, formats=formats)
+
+    assert valid.all()
+    assert result.tolist() == [scalar_parse(s, formats=formats) for s in strings]
+
+
+def test_parse_shape():
+    strings = np.array([[b"2006", b"x"], [b"20060102", b"2006-01-02"]])
+
+    result, valid = vectorized.parse(strings)
+
+    assert result.shape == valid.shape == (2, 2)
+    assert valid.tolist() == [[True, False], [True, True]]
+    assert vectorized.parse([])[0].shape == (0,)
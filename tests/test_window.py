@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from now.now import Now
+from now.window import Window
+
+BOUNDS = [
+    ("12:30", "13:00"),
+    ("9:30", "12:15:30"),
+    ("10-1", "10-15"),
+    ("2022-10", "2022-10-12 10"),
+    ("Oct 9 00:00:00", "2022-10-11 10:30:15"),
+    (datetime(2022, 10, 9, 12), "23"),
+]
+
+
+@pytest.fixture
+def times():
+    start = datetime(2022, 9, 28, 11, 0, 0, 500)
+    return [start + timedelta(minutes=i * 7, seconds=i) for i in range(6000)]
+
+
+@pytest.mark.parametrize("begin, end", BOUNDS)
+def test_contains(times, begin, end):
+    window = Window(begin, end)
+
+    for time in times:
+        expected = Now(time).between(begin, end) if isinstance(begin, str) else None
+        if expected is None:
+            expected = begin <= time <= Now(time).parse(end)
+
+        assert window.contains(time) == expected
+        assert (time in window) == expected
+
+
+@pytest.mark.parametrize("begin, end", BOUNDS)
+def test_filter(times, begin, end):
+    window = Window(begin, end)
+    expected = [time for time in times if window.contains(time)]
+
+    assert window.filter(times) == expected
+    assert window.filter(times, is_sorted=True) == expected
+    assert window.mask(times) == [time in expected for time in times]
+
+
+@pytest.mark.parametrize("begin, end", BOUNDS)
+def test_numpy(times, begin, end):
+    np = pytest.importorskip("numpy")
+
+    window = Window(begin, end)
+    array = np.array(times + [None], dtype="datetime64[us]")
+
+    assert window.mask(array).tolist() == window.mask(times) + [False]
+    assert window.filter(array).tolist() == window.filter(times)
+
+
+def test_anchor():
+    window = Window("12:30", "13:00")
+    time = datetime(2022, 10, 11, 10, 30, 15)
+
+    assert window.anchor(time) == (
+        datetime(2022, 10, 11, 12, 30, 15),
+        datetime(2022, 10, 11, 13, 0, 15),
+    )
+
+
+def test_time_zone():
+    tzinfo = timezone(timedelta(hours=-7))
+    window = Window("12:30", "2022-10-11T20:00:00Z+0000")
+
+    assert window.contains(datetime(2022, 10, 11, 12, 45, tzinfo=tzinfo))
+    assert not window.contains(datetime(2022, 10, 11, 13, 1, tzinfo=tzinfo))
+    assert window.filter(
+        [datetime(2022, 10, 11, 12, 45, tzinfo=tzinfo)], is_sorted=True
+    ) == [datetime(2022, 10, 11, 12, 45, tzinfo=tzinfo)]
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from now import zone
+from now.now import Now, Period, WeekStartDay
+
+SANTIAGO = ZoneInfo("America/Santiago")
+NEW_YORK = ZoneInfo("America/New_York")
+
+BOUNDARIES = {
+    Period.DAY: (Now.beginning_of_day, Now.end_of_day),
+    Period.WEEK: (Now.beginning_of_week, Now.end_of_week),
+    Period.MONTH: (Now.beginning_of_month, Now.end_of_month),
+    Period.QUARTER: (Now.beginning_of_quarter, Now.end_of_quarter),
+    Period.HALF: (Now.beginning_of_half, Now.end_of_half),
+    Period.YEAR: (Now.beginning_of_year, Now.end_of_year),
+}
+
+
+def test_gap():
+    # Clocks in Santiago jumped from 00:00 to 01:00 on 2022-09-11.
+    time = Now(datetime(2022, 9, 11, 15, tzinfo=SANTIAGO), resolve_time_zone=True)
+
+    assert time.beginning_of_day() == datetime(2022, 9, 11, 1, tzinfo=SANTIAGO)
+    assert time.beginning_of_day().utcoffset() == timedelta(hours=-3)
+
+    time.resolve_time_zone = False
+    assert time.beginning_of_day() == datetime(2022, 9, 11, tzinfo=SANTIAGO)
+
+
+def test_ambiguous():
+    # Clocks in Santiago went back from 00:00 to 23:00 on 2022-04-02.
+    time = Now(datetime(2022, 4, 2, 12, tzinfo=SANTIAGO), resolve_time_zone=True)
+    end = time.end_of_day()
+
+    assert end.fold == 1
+    assert end.utcoffset() == timedelta(hours=-4)
+    assert end + timedelta(microseconds=1) == datetime(2022, 4, 3, tzinfo=SANTIAGO)
+
+
+@pytest.mark.parametrize("period", list(Period)[2:])
+@pytest.mark.parametrize("week_start_day", list(WeekStartDay))
+def test_bounds(period, week_start_day):
+    start = datetime(2021, 12, 30, 23, tzinfo=timezone.utc)
+
+    for hours in range(0, 400 * 24, 7):
+        time = (start + timedelta(hours=hours)).astimezone(NEW_YORK)
+        beginning, end = zone.bounds(time, period, week_start_day)
+
+        assert beginning <= time <= end
+        if period is Period.DAY:
+            assert (beginning.hour, end.hour) == (0, 23)
+
+        now = Now(time, week_start_day=week_start_day)
+        beginning_of, end_of = BOUNDARIES[period]
+        # New York switches at 02:00, so the wall-clock boundaries are unaffected.
+        assert beginning == beginning_of(now)
+        assert end == end_of(now)
+
+
+def test_cache():
+    zone.cache_clear()
+    time = datetime(2022, 10, 11, 10, 30, tzinfo=NEW_YORK)
+
+    zone.bounds(time, Period.MONTH)
+    zone.bounds(time.replace(day=20), Period.MONTH)
+
+    assert zone._bounds.cache_info().hits == 1
+
+
+def test_naive():
+    with pytest.raises(ValueError):
+        zone.bounds(datetime(2022, 10, 11), Period.DAY)